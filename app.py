@@ -8,15 +8,38 @@ with conversation management, live monitoring, and XML configuration.
 This is the main entry point that initializes and runs the application.
 """
 
+# Serve SocketIO with eventlet's cooperative I/O when it is installed, so
+# broadcasting to many monitor clients doesn't tie up one thread per client.
+# Monkey patching must happen before anything else imports socket/threading.
+# Provider SDKs that speak gRPC are kept off the hub (Gemini over REST, the
+# xAI SDK through eventlet's thread pool), since gRPC cannot yield to it.
+try:
+    import eventlet
+    eventlet.monkey_patch()
+    ASYNC_MODE = 'eventlet'
+except ImportError:
+    ASYNC_MODE = 'threading'
+
+import os
+import time
+import atexit
 import socket
+from typing import Dict, Tuple
 from flask import Flask
 from flask_cors import CORS
 from flask_socketio import SocketIO
 from dotenv import load_dotenv
 
+import fast_json
 from conversation_manager import ConversationManager
+from conversation_store import ConversationStore
 from prompt_config import PromptConfig
+from cache import LRUCacheBackend, RedisCacheBackend
+from llm_dispatcher import LLMDispatcher
+from semantic_cache import SemanticCache
 from routes import register_routes
+from models import close_clients
+from models.warmup import keep_warm
 
 # Load environment variables
 load_dotenv()
@@ -24,57 +47,129 @@ load_dotenv('.env.gpt5')
 
 # Initialize Flask app
 app = Flask(__name__)
+# Static assets are fingerprinted (?v=<hash>), so browsers may cache them for a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+app.json = fast_json.FastJSONProvider(app)
 CORS(app, origins="*")  # Allow Claude Code to access from any origin
 
-# Initialize SocketIO for real-time updates
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
-
-# Initialize core components
-conversation_manager = ConversationManager(socketio)
+# Initialize SocketIO for real-time updates (orjson-backed payload encoding).
+# The dashboard connects over WebSocket directly, so long-polling is disabled.
+# A generous ping timeout keeps idle dashboards connected through slow model calls.
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE, json=fast_json,
+                    transports=['websocket'], ping_interval=25, ping_timeout=60)
+
+# Initialize core components (conversations persist to SQLite)
+conversation_store = ConversationStore(os.getenv('CONVERSATION_DB', 'conversations.db'))
+conversation_manager = ConversationManager(
+    socketio,
+    emit_interval=float(os.getenv('EMIT_INTERVAL_MS', '50')) / 1000,
+    store=conversation_store
+)
 prompt_config = PromptConfig()
+llm_dispatcher = LLMDispatcher()
+semantic_cache = SemanticCache()
+# Exact-match response cache, shared through Redis when REDIS_URL is set
+response_cache = RedisCacheBackend(os.environ['REDIS_URL']) if os.getenv('REDIS_URL') else LRUCacheBackend()
 
 # Register all routes
-register_routes(app, conversation_manager, prompt_config)
+register_routes(app, conversation_manager, prompt_config, llm_dispatcher, semantic_cache, response_cache)
+
+# Release pooled provider connections on shutdown
+atexit.register(close_clients)
+
+# Open provider connections before the first request needs them, and
+# optionally keep them open (WARMUP_INTERVAL seconds, 0 = once)
+socketio.start_background_task(keep_warm, float(os.getenv('WARMUP_INTERVAL', '0')))
+
+
+# Probe results are remembered briefly, and a port handed out by
+# find_available_port stays reserved for that long, so bursts of lookups
+# neither repeat the socket work nor return the same port twice
+PORT_CACHE_TTL = 5.0
+_port_cache: Dict[Tuple[str, int], Tuple[bool, float]] = {}
 
+# Interface the server listens on, and so the one ports are probed on
+SERVER_HOST = '0.0.0.0'
 
-def is_port_available(port):
+
+def is_port_available(port, host=SERVER_HOST):
     """
     Check if a port is available for binding.
 
+    Results are cached for PORT_CACHE_TTL seconds.
+
     Args:
         port: Port number to check
+        host: Interface the port will be bound on. Probing a specific
+            address such as 127.0.0.1 is cheaper than the wildcard, but
+            only proves the port is free there
 
     Returns:
         True if port is available, False otherwise
     """
+    # Invalid entries never need a socket
+    if not (isinstance(port, int) and 0 < port < 65536):
+        return False
+
+    now = time.monotonic()
+    cached = _port_cache.get((host, port))
+    if cached is not None and now - cached[1] < PORT_CACHE_TTL:
+        return cached[0]
+
+    available = _probe_port(port, host)
+    _port_cache[(host, port)] = (available, now)
+    return available
+
+
+def _probe_port(port, host):
+    """Check a port with real sockets, bypassing the cache"""
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(('0.0.0.0', port))
-            return True
-    except OSError:
+            # Ignore TIME_WAIT leftovers from a previous run so a restart can
+            # reuse the preferred port. SO_REUSEPORT is deliberately not set:
+            # it would let the probe succeed next to a live listener.
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind((host, port))
+            # With SO_REUSEADDR, bind() can succeed next to another bound
+            # socket; listen() is where that conflict shows up
+            s.listen(1)
+    except (OSError, OverflowError):
         return False
 
+    # A server bound only to loopback may not conflict with a wildcard
+    # bind on every platform; make sure nothing answers there either
+    try:
+        with socket.create_connection(('127.0.0.1', port), timeout=0.05):
+            return False
+    except OSError:
+        return True
 
-def find_available_port(preferred_ports):
+
+def find_available_port(preferred_ports, host=SERVER_HOST):
     """
     Find the first available port from a list of preferred ports.
 
     Args:
         preferred_ports: List of port numbers to try in order
+        host: Interface the port will be bound on
 
     Returns:
         First available port number, or None if all are taken
     """
+    seen = set()
     for port in preferred_ports:
-        if is_port_available(port):
+        if port in seen:
+            continue
+        seen.add(port)
+        if is_port_available(port, host):
+            # Reserve it so the next lookup doesn't hand it out again
+            _port_cache[(host, port)] = (False, time.monotonic())
             return port
     return None
 
 
 def main():
     """Main entry point for the application"""
-    import os
-
     # Try ports in order: 3791, then 3003
     preferred_ports = [3791, 3003]
     port = find_available_port(preferred_ports)
@@ -114,7 +209,12 @@ def main():
         print("\nPress CTRL+C to stop the server")
         print("="*60 + "\n")
 
-    socketio.run(app, host='0.0.0.0', port=port, debug=True)
+    # Debug mode (reloader + interactive debugger) is opt-in via FLASK_DEBUG=1.
+    # Without eventlet this falls back to the Werkzeug server, which is fine
+    # for the local single-user setup; use gunicorn_conf.py for deployments.
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    socketio.run(app, host=SERVER_HOST, port=port, debug=debug,
+                 use_reloader=debug, allow_unsafe_werkzeug=True)
 
 
 if __name__ == '__main__':
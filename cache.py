@@ -0,0 +1,107 @@
+"""
+Response Cache
+==============
+Exact-match cache of model responses, keyed by a hash of everything that
+determines the response, with pluggable storage backends.
+"""
+
+import hashlib
+import threading
+import collections
+from typing import Iterable, List, Optional, Protocol
+
+import fast_json
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+def cache_key(model: str, messages: List, reasoning_effort: Optional[str],
+              file_paths: Iterable[str]) -> str:
+    """
+    Hash everything that determines the upstream response.
+
+    Args:
+        model: Model identifier
+        messages: Conversation messages to send
+        reasoning_effort: Requested reasoning effort
+        file_paths: Files attached to the request
+
+    Returns:
+        SHA-256 hex digest identifying the request
+    """
+    payload = fast_json.dumps({
+        'model': model,
+        'reasoning_effort': reasoning_effort,
+        'file_paths': list(file_paths),
+        'messages': [(m.role, m.content) for m in messages]
+    })
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Storage for cached responses"""
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None"""
+        ...
+
+    def set(self, key: str, value: str):
+        """Cache a response under key"""
+        ...
+
+
+class LRUCacheBackend:
+    """In-process cache bounded by entry count, evicting least recently used"""
+
+    def __init__(self, max_entries: int = 10_000):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+        """
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class RedisCacheBackend:
+    """Cache shared between processes through Redis (requires the redis package)"""
+
+    def __init__(self, url: str, ttl: int = 86400, prefix: str = 'model_router:response:'):
+        """
+        Connect to Redis.
+
+        Args:
+            url: Redis connection URL
+            ttl: Seconds before a cached response expires
+            prefix: Key prefix for cached responses
+        """
+        if redis is None:
+            raise ImportError("redis package not found. Please install with: pip install redis")
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: str):
+        self.client.set(self.prefix + key, value, ex=self.ttl)
@@ -1,31 +1,80 @@
 """
 Conversation Manager
 ====================
-Manages all active conversations with thread-safe operations.
+Manages all active conversations with thread-safe operations and optional
+SQLite persistence.
 """
 
 import uuid
+import time
+import heapq
+import logging
 import threading
+import collections
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
 
 from data_models import Message, Conversation
+from conversation_store import ConversationStore
+
+logger = logging.getLogger(__name__)
 
 
 class ConversationManager:
     """Manages all active conversations with WebSocket integration"""
 
-    def __init__(self, socketio):
+    def __init__(self, socketio, emit_interval: float = 0.01,
+                 store: Optional[ConversationStore] = None, cache_size: int = 512):
         """
         Initialize the conversation manager.
 
         Args:
             socketio: Flask-SocketIO instance for real-time updates
+            emit_interval: Seconds to wait for more messages before flushing
+                a batch of WebSocket events
+            store: Optional ConversationStore for persistence. When given, only
+                the most recently used conversations are kept in memory.
+            cache_size: Maximum number of conversations kept in memory when a
+                store is configured
         """
-        self.conversations: Dict[str, Conversation] = {}
-        self.lock = threading.Lock()
+        # Conversations held in memory, least recently used first. Without a
+        # store this holds every conversation.
+        self.conversations: Dict[str, Conversation] = collections.OrderedDict()
         self.socketio = socketio
+        self.store = store
+        self.cache_size = cache_size
+
+        # Guards the in-memory dicts and expiry heap only; message history
+        # is guarded by each conversation's own lock
+        self._dict_lock = threading.Lock()
+
+        # Summary dicts for list_conversations (one per known conversation,
+        # in memory or not), rebuilt only when a conversation changes
+        self._summaries: Dict[str, Dict] = {}
+
+        # Changes whenever any summary does; the random prefix keeps versions
+        # from different server runs apart
+        self._summaries_epoch = uuid.uuid4().hex[:8]
+        self._summaries_version = 0
+
+        # Latest updated_ts per conversation, and a min-heap of
+        # (updated_ts, conv_id) for expiry; stale entries are skipped lazily
+        self._updated_ts: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+
+        if self.store is not None:
+            for summary in self.store.load_summaries():
+                updated_ts = summary.pop('updated_ts')
+                self._summaries[summary['id']] = summary
+                self._updated_ts[summary['id']] = updated_ts
+                self._expiry_heap.append((updated_ts, summary['id']))
+            heapq.heapify(self._expiry_heap)
+
+        # Pending WebSocket payloads, flushed in batches by a background task
+        self._emit_queue = collections.deque()
+        self._flush_event = threading.Event()
+        self._emit_interval = emit_interval
+        self.socketio.start_background_task(self._flush_loop)
 
     def create_conversation(self, model: str, metadata: Optional[Dict] = None) -> str:
         """
@@ -36,25 +85,39 @@ class ConversationManager:
             metadata: Optional metadata dictionary
 
         Returns:
-            Unique conversation ID (UUID)
-        """
-        with self.lock:
-            conv_id = str(uuid.uuid4())
-            now = datetime.now().isoformat()
-            self.conversations[conv_id] = Conversation(
-                id=conv_id,
-                model=model,
-                messages=[],
-                created_at=now,
-                updated_at=now,
-                metadata=metadata or {}
-            )
-            self._cleanup_old_conversations()
-            return conv_id
+            Unique conversation ID (32-char hex UUID)
+        """
+        conv_id = uuid.uuid4().hex
+        now_ts = time.time()
+        now = datetime.fromtimestamp(now_ts).isoformat()
+        conversation = Conversation(
+            id=conv_id,
+            model=model,
+            messages=[],
+            created_at=now,
+            updated_at=now,
+            metadata=metadata or {},
+            updated_ts=now_ts
+        )
+        # Disk writes happen outside the dict lock, so lookups never wait on them
+        if self.store is not None:
+            self.store.save_conversation(conversation)
+
+        with self._dict_lock:
+            self._cache(conversation)
+            self._summaries[conv_id] = self._summarize(conversation)
+            self._summaries_version += 1
+            self._updated_ts[conv_id] = now_ts
+            heapq.heappush(self._expiry_heap, (now_ts, conv_id))
+            expired = self._expire_old_conversations()
+
+        if expired:
+            self._delete_stored(expired)
+        return conv_id
 
     def add_message(self, conv_id: str, role: str, content: str, model: Optional[str] = None):
         """
-        Add a message to a conversation and emit WebSocket event.
+        Add a message to a conversation and queue a WebSocket event.
 
         Args:
             conv_id: Conversation ID
@@ -62,22 +125,93 @@ class ConversationManager:
             content: Message content
             model: Optional model identifier
         """
-        with self.lock:
-            if conv_id in self.conversations:
-                message = Message(
-                    role=role,
-                    content=content,
-                    timestamp=datetime.now().isoformat(),
-                    model=model
-                )
-                self.conversations[conv_id].messages.append(message)
-                self.conversations[conv_id].updated_at = datetime.now().isoformat()
-
-                # Emit to WebSocket for live monitoring
-                self.socketio.emit('new_message', {
-                    'conversation_id': conv_id,
-                    'message': asdict(message)
-                })
+        conversation = self.get_conversation(conv_id)
+        if conversation is None:
+            return
+
+        with conversation.lock:
+            # One clock read shared by the message and the conversation
+            updated_ts = time.time()
+            timestamp = datetime.fromtimestamp(updated_ts).isoformat()
+            message = Message(
+                role=role,
+                content=content,
+                timestamp=timestamp,
+                model=model
+            )
+
+            # Persist first, so memory never holds a message the store lacks
+            if self.store is not None and not self.store.append_message(conversation, message, updated_ts):
+                return  # Deleted or expired meanwhile
+
+            conversation.messages.append(message)
+            conversation.updated_at = timestamp
+            conversation.updated_ts = updated_ts
+            conversation.version += 1
+            summary = self._summarize(conversation)
+
+            # Publish while still holding the conversation lock so summaries
+            # of concurrent appends can't be applied out of order
+            with self._dict_lock:
+                if conv_id not in self._summaries:
+                    return  # Deleted or expired meanwhile
+                self._summaries[conv_id] = summary
+                self._summaries_version += 1
+                self._updated_ts[conv_id] = updated_ts
+                heapq.heappush(self._expiry_heap, (updated_ts, conv_id))
+
+        # Queue for the batched WebSocket flush (live monitoring)
+        self._emit_queue.append({
+            'conversation_id': conv_id,
+            'message': message.to_dict(),
+            'summary': summary
+        })
+        self._flush_event.set()
+
+    def add_chunk(self, conv_id: str, delta: str):
+        """
+        Queue a piece of a streaming response for live monitoring.
+
+        Chunks are only broadcast; the full response is stored by a later
+        add_message call.
+
+        Args:
+            conv_id: Conversation ID
+            delta: Newly generated text
+        """
+        self._emit_queue.append({'conversation_id': conv_id, 'delta': delta})
+        self._flush_event.set()
+
+    def save_context_summary(self, conversation: Conversation, summary: str, summary_upto: int):
+        """
+        Record a new summary of the history outside the context window.
+
+        Args:
+            conversation: Conversation the summary belongs to
+            summary: Summary text
+            summary_upto: History index the summary covers up to (exclusive)
+        """
+        with conversation.lock:
+            if summary_upto <= conversation.summary_upto:
+                return  # A newer summary is already in place
+            if self.store is not None:
+                self.store.save_summary(conversation.id, summary, summary_upto)
+            conversation.summary = summary
+            conversation.summary_upto = summary_upto
+
+    def fail_stream(self, conv_id: str, error: str):
+        """
+        Announce that a streaming response ended without a complete message.
+
+        Queued behind the chunks already relayed, so dashboards can close
+        the partial message they have been building.
+
+        Args:
+            conv_id: Conversation ID
+            error: Why the stream ended
+        """
+        self._emit_queue.append({'conversation_id': conv_id, 'stream_error': error})
+        self._flush_event.set()
 
     def get_conversation(self, conv_id: str) -> Optional[Conversation]:
         """
@@ -89,8 +223,28 @@ class ConversationManager:
         Returns:
             Conversation object or None if not found
         """
-        with self.lock:
-            return self.conversations.get(conv_id)
+        with self._dict_lock:
+            conversation = self.conversations.get(conv_id)
+            if conversation is not None:
+                self.conversations.move_to_end(conv_id)
+                return conversation
+            if self.store is None or conv_id not in self._summaries:
+                return None
+
+        # Not in memory: load from the store without holding the dict lock
+        loaded = self.store.load_conversation(conv_id)
+        if loaded is None:
+            return None
+
+        with self._dict_lock:
+            if conv_id not in self._summaries:
+                return None  # Deleted while loading
+            # Another thread may have loaded it concurrently; keep one copy
+            conversation = self.conversations.get(conv_id)
+            if conversation is None:
+                conversation = loaded
+                self._cache(conversation)
+            return conversation
 
     def list_conversations(self) -> List[Dict]:
         """
@@ -99,18 +253,18 @@ class ConversationManager:
         Returns:
             List of conversation summary dictionaries
         """
-        with self.lock:
-            return [
-                {
-                    'id': conv.id,
-                    'model': conv.model,
-                    'message_count': len(conv.messages),
-                    'created_at': conv.created_at,
-                    'updated_at': conv.updated_at,
-                    'metadata': conv.metadata
-                }
-                for conv in self.conversations.values()
-            ]
+        with self._dict_lock:
+            return list(self._summaries.values())
+
+    def list_version(self) -> str:
+        """
+        Get a token that changes whenever list_conversations would.
+
+        Returns:
+            Opaque version string, usable as an ETag
+        """
+        with self._dict_lock:
+            return f"{self._summaries_epoch}-{self._summaries_version}"
 
     def delete_conversation(self, conv_id: str) -> bool:
         """
@@ -122,18 +276,152 @@ class ConversationManager:
         Returns:
             True if deleted, False if not found
         """
-        with self.lock:
-            if conv_id in self.conversations:
-                del self.conversations[conv_id]
-                return True
-            return False
-
-    def _cleanup_old_conversations(self):
-        """Remove conversations older than 20 days"""
-        cutoff = datetime.now() - timedelta(days=20)
-        to_remove = []
-        for conv_id, conv in self.conversations.items():
-            if datetime.fromisoformat(conv.updated_at) < cutoff:
-                to_remove.append(conv_id)
-        for conv_id in to_remove:
-            del self.conversations[conv_id]
+        with self._dict_lock:
+            if conv_id not in self._summaries:
+                return False
+            self._forget(conv_id)
+
+        self._delete_stored([conv_id])
+        return True
+
+    def _delete_stored(self, conv_ids: List[str]):
+        """
+        Delete forgotten conversations from the store and announce them.
+
+        Called without the dict lock held. Lookups already miss these
+        conversations, since they were forgotten in memory first.
+
+        Args:
+            conv_ids: IDs of the conversations to delete
+        """
+        if self.store is not None:
+            self.store.delete_conversations(conv_ids)
+        # Queue a conversations_deleted event so dashboards drop the conversations
+        self._emit_queue.append({'deleted': conv_ids})
+        self._flush_event.set()
+
+    def _cache(self, conversation: Conversation):
+        """Add a conversation to memory, evicting the least recently used if a store is configured"""
+        self.conversations[conversation.id] = conversation
+        if self.store is not None:
+            while len(self.conversations) > self.cache_size:
+                self.conversations.popitem(last=False)
+
+    def _forget(self, conv_id: str):
+        """Remove all in-memory state for a conversation"""
+        self.conversations.pop(conv_id, None)
+        del self._summaries[conv_id]
+        self._summaries_version += 1
+        del self._updated_ts[conv_id]
+
+    @staticmethod
+    def _summarize(conv: Conversation) -> Dict:
+        """
+        Build the list_conversations summary for a conversation.
+
+        Args:
+            conv: Conversation to summarize
+
+        Returns:
+            Conversation summary dictionary
+        """
+        return {
+            'id': conv.id,
+            'model': conv.model,
+            'message_count': len(conv.messages),
+            'created_at': conv.created_at,
+            'updated_at': conv.updated_at,
+            'metadata': conv.metadata
+        }
+
+    def _flush_loop(self):
+        """Flush queued WebSocket events whenever new ones arrive, for the life of the process"""
+        while True:
+            self._flush_event.wait()
+            self._flush_event.clear()
+
+            # Give a burst a moment to accumulate before flushing
+            self.socketio.sleep(self._emit_interval)
+
+            # A failed emit loses that flush's events, not the live updates
+            # for the rest of the process
+            try:
+                self._flush()
+            except Exception:
+                logger.exception("Failed to emit queued WebSocket events")
+
+    def _flush(self):
+        """
+        Drain queued messages and emit them as a single batch event, followed
+        by one conversation_updated event per conversation that changed.
+        Consecutive streaming chunks are merged per conversation into one
+        message_chunk event, keeping their order relative to the messages.
+        Failed streams are announced with a stream_error event in queue
+        order. Deleted and expired conversations are announced last, in a
+        single conversations_deleted event.
+        """
+        batch = []
+        deltas = {}
+        updated = {}
+        deleted = set()
+        while self._emit_queue:
+            item = self._emit_queue.popleft()
+            if 'deleted' in item:
+                deleted.update(item['deleted'])
+            elif 'stream_error' in item:
+                if batch:
+                    self.socketio.emit('new_messages_batch', batch)
+                    batch = []
+                if deltas:
+                    self._emit_chunks(deltas)
+                    deltas = {}
+                self.socketio.emit('stream_error', {
+                    'conversation_id': item['conversation_id'],
+                    'error': item['stream_error']
+                })
+            elif 'delta' in item:
+                if batch:
+                    self.socketio.emit('new_messages_batch', batch)
+                    batch = []
+                deltas.setdefault(item['conversation_id'], []).append(item['delta'])
+            else:
+                if deltas:
+                    self._emit_chunks(deltas)
+                    deltas = {}
+                # Only the latest summary per conversation is worth sending
+                updated[item['conversation_id']] = item.pop('summary')
+                batch.append(item)
+
+        if deltas:
+            self._emit_chunks(deltas)
+        if batch:
+            self.socketio.emit('new_messages_batch', batch)
+        for conv_id, summary in updated.items():
+            if conv_id not in deleted:
+                self.socketio.emit('conversation_updated', summary)
+        if deleted:
+            self.socketio.emit('conversations_deleted', list(deleted))
+
+    def _emit_chunks(self, deltas: Dict[str, List[str]]):
+        """Emit one message_chunk event per conversation with its merged text"""
+        for conv_id, parts in deltas.items():
+            self.socketio.emit('message_chunk', {'conversation_id': conv_id, 'delta': ''.join(parts)})
+
+    def _expire_old_conversations(self) -> List[str]:
+        """
+        Forget conversations older than 20 days. Call with the dict lock
+        held, then pass the result to _delete_stored once it is released.
+
+        Returns:
+            IDs of the expired conversations
+        """
+        cutoff_ts = time.time() - timedelta(days=20).total_seconds()
+        heap = self._expiry_heap
+        expired = []
+        while heap and heap[0][0] < cutoff_ts:
+            ts, conv_id = heapq.heappop(heap)
+            # Skip entries superseded by a newer update or an explicit delete
+            if self._updated_ts.get(conv_id) == ts:
+                self._forget(conv_id)
+                expired.append(conv_id)
+        return expired
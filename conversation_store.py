@@ -0,0 +1,217 @@
+"""
+Conversation Store
+==================
+SQLite-backed persistence for conversations and their messages.
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from data_models import Message, Conversation
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    id TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    updated_ts REAL NOT NULL,
+    metadata TEXT NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    summary TEXT,
+    summary_upto INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_conversations_updated_ts ON conversations(updated_ts);
+CREATE TABLE IF NOT EXISTS messages (
+    conv_id TEXT NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    model TEXT,
+    metadata TEXT,
+    PRIMARY KEY (conv_id, idx)
+);
+"""
+
+# Columns added after the first release, created on databases that predate them
+MIGRATIONS = {
+    'summary': 'ALTER TABLE conversations ADD COLUMN summary TEXT',
+    'summary_upto': 'ALTER TABLE conversations ADD COLUMN summary_upto INTEGER NOT NULL DEFAULT 1',
+}
+
+
+class ConversationStore:
+    """Persists conversations to a SQLite database in WAL mode"""
+
+    def __init__(self, db_path: str = 'conversations.db'):
+        """
+        Open (or create) the conversation database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(conversations)')}
+        with self.conn:
+            for column, statement in MIGRATIONS.items():
+                if column not in columns:
+                    self.conn.execute(statement)
+
+    def save_conversation(self, conv: Conversation):
+        """
+        Insert a new conversation (without messages).
+
+        Args:
+            conv: Conversation to persist
+        """
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO conversations (id, model, created_at, updated_at, updated_ts, metadata, message_count) '
+                'VALUES (?, ?, ?, ?, ?, ?, 0)',
+                (conv.id, conv.model, conv.created_at, conv.updated_at, conv.updated_ts,
+                 json.dumps(conv.metadata))
+            )
+
+    def append_message(self, conv: Conversation, message: Message, updated_ts: float) -> bool:
+        """
+        Persist a message about to be appended to a conversation.
+
+        Args:
+            conv: Conversation the message will be appended to (not yet updated)
+            message: The new message, stored at index len(conv.messages)
+            updated_ts: Epoch seconds of message.timestamp, the conversation's
+                new updated_ts
+
+        Returns:
+            True if stored, False if the conversation no longer exists
+
+        Raises:
+            sqlite3.IntegrityError: If the message index is already taken
+                (e.g. written from a stale copy of the conversation)
+        """
+        index = len(conv.messages)
+        with self.lock, self.conn:
+            exists = self.conn.execute('SELECT 1 FROM conversations WHERE id = ?', (conv.id,)).fetchone()
+            if exists is None:
+                return False  # Deleted meanwhile
+            self.conn.execute(
+                'INSERT INTO messages (conv_id, idx, role, content, timestamp, model, metadata) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (conv.id, index, message.role, message.content, message.timestamp,
+                 message.model, json.dumps(message.metadata) if message.metadata is not None else None)
+            )
+            self.conn.execute(
+                'UPDATE conversations SET updated_at = ?, updated_ts = ?, message_count = ? WHERE id = ?',
+                (message.timestamp, updated_ts, index + 1, conv.id)
+            )
+        return True
+
+    def save_summary(self, conv_id: str, summary: str, summary_upto: int):
+        """
+        Persist the summary standing in for history outside the context window.
+
+        Args:
+            conv_id: Conversation ID
+            summary: Summary text
+            summary_upto: History index the summary covers up to (exclusive)
+        """
+        with self.lock, self.conn:
+            self.conn.execute(
+                'UPDATE conversations SET summary = ?, summary_upto = ? WHERE id = ?',
+                (summary, summary_upto, conv_id)
+            )
+
+    def load_conversation(self, conv_id: str) -> Optional[Conversation]:
+        """
+        Load a conversation with its full message history.
+
+        Args:
+            conv_id: Conversation ID
+
+        Returns:
+            Conversation object or None if not found
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT id, model, created_at, updated_at, updated_ts, metadata, summary, summary_upto '
+                'FROM conversations WHERE id = ?',
+                (conv_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            message_rows = self.conn.execute(
+                'SELECT role, content, timestamp, model, metadata FROM messages WHERE conv_id = ? ORDER BY idx',
+                (conv_id,)
+            ).fetchall()
+
+        messages = [
+            Message(
+                role=role,
+                content=content,
+                timestamp=timestamp,
+                model=model,
+                metadata=json.loads(metadata) if metadata is not None else None
+            )
+            for role, content, timestamp, model, metadata in message_rows
+        ]
+        return Conversation(
+            id=row[0],
+            model=row[1],
+            messages=messages,
+            created_at=row[2],
+            updated_at=row[3],
+            metadata=json.loads(row[5]),
+            updated_ts=row[4],
+            summary=row[6],
+            summary_upto=row[7]
+        )
+
+    def load_summaries(self) -> List[Dict]:
+        """
+        Load summary information for every stored conversation.
+
+        Returns:
+            List of summary dictionaries, each including 'updated_ts'
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT id, model, message_count, created_at, updated_at, metadata, updated_ts FROM conversations'
+            ).fetchall()
+
+        return [
+            {
+                'id': conv_id,
+                'model': model,
+                'message_count': message_count,
+                'created_at': created_at,
+                'updated_at': updated_at,
+                'metadata': json.loads(metadata),
+                'updated_ts': updated_ts
+            }
+            for conv_id, model, message_count, created_at, updated_at, metadata, updated_ts in rows
+        ]
+
+    def delete_conversations(self, conv_ids: Iterable[str]):
+        """
+        Delete conversations and their messages.
+
+        Args:
+            conv_ids: IDs of the conversations to delete
+        """
+        with self.lock, self.conn:
+            self.conn.executemany('DELETE FROM conversations WHERE id = ?', [(cid,) for cid in conv_ids])
+
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.conn.close()
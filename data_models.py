@@ -4,11 +4,15 @@ Data Models
 Core data structures for representing messages and conversations.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
+import fast_json
 
-@dataclass
+
+@dataclass(slots=True)
 class Message:
     """Represents a single message in a conversation"""
     role: str  # 'user' or 'assistant'
@@ -16,9 +20,30 @@ class Message:
     timestamp: str
     model: Optional[str] = None
     metadata: Optional[Dict] = None
+    _dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> Dict:
+        """
+        Get the serializable dict form of this message.
+
+        Messages are not mutated after creation, so the dict is built once
+        and reused by every WebSocket emit and API response.
+
+        Returns:
+            Dictionary with the message fields
+        """
+        if self._dict is None:
+            self._dict = {
+                'role': self.role,
+                'content': self.content,
+                'timestamp': self.timestamp,
+                'model': self.model,
+                'metadata': self.metadata
+            }
+        return self._dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """Represents a conversation with history"""
     id: str
@@ -27,3 +52,41 @@ class Conversation:
     created_at: str
     updated_at: str
     metadata: Dict
+    updated_ts: float = 0.0  # Epoch seconds of updated_at, used for expiry
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    version: int = field(default=0, repr=False, compare=False)  # Bumped on every change
+    # Summary of messages[1:summary_upto], standing in for history outside the context window
+    summary: Optional[str] = field(default=None, repr=False, compare=False)
+    summary_upto: int = field(default=1, repr=False, compare=False)
+    # A summary call is in flight, or failed and must not be retried before summary_retry_at
+    summary_pending: bool = field(default=False, repr=False, compare=False)
+    summary_failures: int = field(default=0, repr=False, compare=False)
+    summary_retry_at: float = field(default=0.0, repr=False, compare=False)  # time.monotonic()
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _json_etag: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _json_version: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def to_json(self) -> Tuple[bytes, str]:
+        """
+        Get the JSON document for this conversation with its full history.
+
+        The document is serialized, encoded and hashed once per version and
+        reused by every read until the conversation changes. Call with
+        self.lock held.
+
+        Returns:
+            Tuple of (UTF-8 JSON with the conversation fields and messages,
+            entity tag of that body)
+        """
+        if self._json_version != self.version:
+            self._json = fast_json.dumps({
+                'id': self.id,
+                'model': self.model,
+                'created_at': self.created_at,
+                'updated_at': self.updated_at,
+                'metadata': self.metadata,
+                'messages': [msg.to_dict() for msg in self.messages]
+            }).encode('utf-8')
+            self._json_etag = hashlib.md5(self._json, usedforsecurity=False).hexdigest()
+            self._json_version = self.version
+        return self._json, self._json_etag
@@ -0,0 +1,124 @@
+"""
+Fast JSON
+=========
+JSON encoding helpers and a Flask JSON provider backed by orjson, falling
+back to the standard library when orjson is not installed or cannot
+encode a value.
+"""
+
+import json
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, **kwargs) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Accepts and ignores stdlib-style keyword arguments (such as
+    ``separators``) so this module can be passed anywhere a ``json``
+    module is expected, e.g. ``SocketIO(json=fast_json)``.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except TypeError:
+            # orjson rejects some types the stdlib accepts (e.g. int subclasses
+            # in keys); fall through to the stdlib encoder
+            pass
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def loads(data, **kwargs) -> Any:
+    """
+    Deserialize a JSON string or bytes.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        Deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses with orjson"""
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        """
+        Serialize an object for a Flask response.
+
+        Matches the default provider's output (sorted keys, indentation in
+        debug mode) and defers to it for values orjson cannot encode.
+
+        Args:
+            obj: Object to serialize
+            **kwargs: Options from Flask (e.g. ``indent``)
+
+        Returns:
+            JSON string
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, option=self._option(kwargs.get('indent'))).decode('utf-8')
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        """
+        Build a JSON response (what ``jsonify`` calls).
+
+        Writes orjson's bytes straight into the response body, skipping the
+        decode to str and re-encode that going through dumps would cost.
+
+        Returns:
+            Flask response object
+        """
+        if orjson is not None:
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = (self.compact is None and self._app.debug) or self.compact is False
+            try:
+                body = orjson.dumps(obj, option=self._option(indent)) + b'\n'
+            except TypeError:
+                return super().response(*args, **kwargs)
+            return self._app.response_class(body, mimetype=self.mimetype)
+        return super().response(*args, **kwargs)
+
+    def _option(self, indent) -> int:
+        """orjson option flags matching the default provider's settings"""
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def loads(self, s, **kwargs) -> Any:
+        """
+        Deserialize a request body.
+
+        Args:
+            s: JSON document as str or bytes
+
+        Returns:
+            Deserialized object
+        """
+        if orjson is not None:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
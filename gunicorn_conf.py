@@ -0,0 +1,27 @@
+"""
+Gunicorn Configuration
+======================
+Production server settings for the Model Router.
+
+Run with:
+    gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '3791')}"
+
+# eventlet multiplexes all WebSocket clients and in-flight model calls
+# cooperatively inside one worker
+worker_class = 'eventlet'
+
+# A single worker: conversations, the live-monitor emit queue and
+# Socket.IO sessions all live in process memory, so multiple workers would
+# each see a different set of conversations and clients. Scale with
+# worker_connections instead.
+workers = 1
+worker_connections = 1000
+
+# Model calls routinely take minutes (o3-pro, GPT-5 Pro at high effort)
+timeout = 600
+graceful_timeout = 30
@@ -0,0 +1,78 @@
+"""
+LLM Dispatcher
+==============
+Runs model API calls on a shared worker pool and coalesces identical
+in-flight requests so duplicates share a single upstream call.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from cache import cache_key
+
+
+class LLMDispatcher:
+    """Submits model calls to a worker pool with request coalescing"""
+
+    def __init__(self, max_workers: int = 16):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_workers: Maximum number of concurrent upstream model calls
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm')
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, handler: Callable, messages: List, model: str, data: Dict) -> Future:
+        """
+        Submit a model call, or join an identical call already in flight.
+
+        Args:
+            handler: Model handler taking (messages, model, data)
+            messages: Conversation messages to send
+            model: Model identifier
+            data: Request options passed through to the handler
+
+        Returns:
+            Future resolving to the model's response text
+        """
+        key = self._request_key(messages, model, data)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = self._executor.submit(handler, messages, model, data)
+            self._inflight[key] = future
+
+        # Registered outside the lock: the callback runs immediately (and
+        # takes the lock) if the call has already finished
+        future.add_done_callback(lambda f: self._discard(key, f))
+        return future
+
+    def shutdown(self):
+        """Stop accepting work and wait for running calls to finish"""
+        self._executor.shutdown(wait=True)
+
+    def _discard(self, key: str, future: Future):
+        """Forget a finished call so later identical requests go upstream again"""
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    @staticmethod
+    def _request_key(messages: List, model: str, data: Dict) -> str:
+        """
+        Hash everything that determines the upstream response.
+
+        Args:
+            messages: Conversation messages to send
+            model: Model identifier
+            data: Request options passed through to the handler
+
+        Returns:
+            Hex digest identifying the request
+        """
+        return cache_key(model, messages, data.get('reasoning_effort', 'high'), data.get('file_paths', []))
@@ -5,13 +5,16 @@ Models Package
 Modular API clients for different AI models.
 """
 
-from .gpt5_client import GPT5Client, call_gpt5
+from ._http import close_clients
+from ._types import Message
+from .gpt5_client import GPT5Client, call_gpt5, stream_gpt5
 from .o3_client import O3Client, call_o3_pro
-from .claude_client import ClaudeClient, call_claude
-from .grok_client import GrokClient, call_grok
-from .gemini_client import GeminiClient, call_gemini
+from .claude_client import ClaudeClient, call_claude, stream_claude
+from .grok_client import GrokClient, call_grok, stream_grok
+from .gemini_client import GeminiClient, call_gemini, stream_gemini
 
 __all__ = [
+    'Message',
     'GPT5Client',
     'O3Client',
     'ClaudeClient',
@@ -22,4 +25,9 @@ __all__ = [
     'call_claude',
     'call_grok',
     'call_gemini',
+    'stream_gpt5',
+    'stream_claude',
+    'stream_grok',
+    'stream_gemini',
+    'close_clients',
 ]
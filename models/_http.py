@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Clients
+===================
+OpenAI SDK clients shared by every model client that talks to an
+OpenAI-compatible API. Each SDK client owns a keep-alive connection pool,
+so sharing one per endpoint reuses connections across requests.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+
+_clients: Dict[Tuple[str, Optional[str]], 'OpenAI'] = {}
+_lock = threading.Lock()
+
+
+def openai_client(api_key: str, base_url: Optional[str] = None) -> 'OpenAI':
+    """
+    Return the shared OpenAI SDK client for an API key and endpoint
+
+    Args:
+        api_key: API key
+        base_url: Optional base URL for OpenAI-compatible providers
+
+    Returns:
+        Shared OpenAI client
+    """
+    key = (api_key, base_url)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            # Imported on first use: the SDK is slow to import and not
+            # needed until an OpenAI-compatible provider is called
+            from openai import OpenAI
+            client = OpenAI(api_key=api_key, base_url=base_url)
+            _clients[key] = client
+        return client
+
+
+def close_clients():
+    """Close every shared client and its connection pool"""
+    with _lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
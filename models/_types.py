@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Shared Types
+============
+Types shared by all model API clients.
+"""
+
+from typing import Optional
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Message:
+    """Represents a single message in a conversation"""
+    role: str  # 'user', 'assistant', or 'system'
+    content: str
+    timestamp: str
+    model: Optional[str] = None
+    metadata: Optional[dict] = None
@@ -6,19 +6,20 @@ Handles all interactions with Anthropic's Claude models including Sonnet 4.5.
 """
 
 import os
-from typing import List, Optional
-from dataclasses import dataclass
+import functools
+from typing import Iterator, List, Optional
 import anthropic
 
+from ._types import Message
+from .resilience import CircuitBreaker, retry, retry_stream
 
-@dataclass
-class Message:
-    """Represents a single message in a conversation"""
-    role: str  # 'user' or 'assistant'
-    content: str
-    timestamp: str
-    model: Optional[str] = None
-    metadata: Optional[dict] = None
+
+# Errors worth retrying: network failures, rate limits and server-side errors
+TRANSIENT_ERRORS = (
+    anthropic.APIConnectionError,
+    anthropic.RateLimitError,
+    anthropic.InternalServerError,
+)
 
 
 class ClaudeClient:
@@ -30,7 +31,7 @@ class ClaudeClient:
         'claude-sonnet': 'claude-sonnet-4-5-20250929',
         'claude-sonnet-4.5': 'claude-sonnet-4-5-20250929',
         'claude-opus': 'claude-opus-4-1-20250805',
-        'claude-haiku': 'claude-haiku-20250305',
+        'claude-haiku': 'claude-haiku-4-5-20251001',
     }
 
     def __init__(self, api_key: Optional[str] = None):
@@ -44,7 +45,7 @@ class ClaudeClient:
         if not self.api_key:
             raise ValueError("Anthropic API key not provided and ANTHROPIC_API_KEY environment variable not set")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = _anthropic_client(self.api_key)
 
     def call(
         self,
@@ -68,36 +69,117 @@ class ClaudeClient:
             The model's response text
 
         Raises:
-            Exception: If the API call fails
+            anthropic.APIError: If the API call fails (transient errors are retried first)
+            CircuitOpenError: If the model has been failing repeatedly
+        """
+        api_params = self._build_params(messages, model, max_tokens, temperature, system)
+
+        # Call Claude API
+        response = self._create(api_params)
+
+        return response.content[0].text
+
+    def stream(
+        self,
+        messages: List[Message],
+        model: str = "claude-sonnet-4-5-20250929",
+        max_tokens: int = 4000,
+        temperature: Optional[float] = None,
+        system: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Call Claude API, yielding the response text as it is generated
+
+        Args:
+            messages: List of conversation messages
+            model: Model to use (can use friendly names like 'claude' or full model IDs)
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature (0.0 to 1.0). If None, uses Claude's default
+            system: Optional system prompt
+
+        Yields:
+            Successive pieces of the model's response text
+
+        Raises:
+            anthropic.APIError: If the API call fails (transient errors are
+                retried until the first piece has been yielded, not after,
+                since part of the response may already have been relayed)
+            CircuitOpenError: If the model has been failing repeatedly
+        """
+        api_params = self._build_params(messages, model, max_tokens, temperature, system)
+
+        yield from retry_stream(lambda: self._stream_texts(api_params), TRANSIENT_ERRORS)
+
+    def _stream_texts(self, api_params: dict) -> Iterator[str]:
+        """
+        Open a streaming Messages API request
+
+        Args:
+            api_params: Keyword arguments for client.messages.stream
+
+        Yields:
+            Successive pieces of the response text
+        """
+        with _breaker(api_params["model"]):
+            with self.client.messages.stream(**api_params) as stream:
+                yield from stream.text_stream
+
+    @retry(TRANSIENT_ERRORS)
+    def _create(self, api_params: dict):
+        """
+        Send a Messages API request, retrying transient errors
+
+        Args:
+            api_params: Keyword arguments for client.messages.create
+
+        Returns:
+            The API response
         """
-        try:
-            # Map friendly model names to full model IDs
-            resolved_model = self.MODEL_MAP.get(model, model)
+        with _breaker(api_params["model"]):
+            return self.client.messages.create(**api_params)
 
-            # Convert messages to Anthropic format
-            formatted_messages = self._format_messages(messages)
+    def _build_params(
+        self,
+        messages: List[Message],
+        model: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        system: Optional[str]
+    ) -> dict:
+        """
+        Build the Messages API parameters for a call
 
-            # Build API call parameters
-            api_params = {
-                "model": resolved_model,
-                "max_tokens": max_tokens,
-                "messages": formatted_messages
-            }
+        Args:
+            messages: List of conversation messages
+            model: Friendly model name or full model ID
+            max_tokens: Maximum tokens in response
+            temperature: Optional sampling temperature
+            system: Optional system prompt
+
+        Returns:
+            Keyword arguments for client.messages.create / stream
+        """
+        resolved_model = resolve_model(model)
 
-            # Add optional parameters if provided
-            if temperature is not None:
-                api_params["temperature"] = temperature
+        # The Messages API takes system prompts as a separate parameter
+        system_prompts = [system] if system else []
+        system_prompts += [msg.content for msg in messages if msg.role == "system"]
 
-            if system:
-                api_params["system"] = system
+        # Build API call parameters
+        api_params = {
+            "model": resolved_model,
+            "max_tokens": max_tokens,
+            "messages": self._format_messages([msg for msg in messages if msg.role != "system"])
+        }
 
-            # Call Claude API
-            response = self.client.messages.create(**api_params)
+        # Add optional parameters if provided
+        if temperature is not None:
+            api_params["temperature"] = temperature
 
-            return response.content[0].text
+        if system_prompts:
+            api_params["system"] = "\n\n".join(system_prompts)
 
-        except Exception as e:
-            return f"Error calling Claude: {str(e)}"
+        return api_params
 
     def _format_messages(self, messages: List[Message]) -> List[dict]:
         """
@@ -109,17 +191,13 @@ class ClaudeClient:
         Returns:
             List of message dictionaries in Anthropic format
         """
-        formatted = []
-        for msg in messages:
-            formatted.append({
-                "role": msg.role,
-                "content": msg.content
-            })
-        return formatted
+        return [{"role": msg.role, "content": msg.content} for msg in messages]
 
-    def get_model_info(self, model: str = "claude") -> dict:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def get_model_info(model: str = "claude") -> dict:
         """
-        Get information about a Claude model
+        Get information about a Claude model (memoized; do not mutate the result)
 
         Args:
             model: Model name or ID
@@ -127,7 +205,7 @@ class ClaudeClient:
         Returns:
             Dictionary with model information
         """
-        resolved_model = self.MODEL_MAP.get(model, model)
+        resolved_model = resolve_model(model)
 
         return {
             "friendly_name": model,
@@ -137,6 +215,43 @@ class ClaudeClient:
         }
 
 
+# Friendly names keyed in lowercase, so 'Claude' and 'claude' both resolve
+_MODEL_MAP = {name.lower(): model_id for name, model_id in ClaudeClient.MODEL_MAP.items()}
+_MODEL_RESOLVE = _MODEL_MAP.get
+
+
+@functools.lru_cache(maxsize=64)
+def resolve_model(model: str) -> str:
+    """
+    Map a friendly model name to its full model ID (case-insensitive)
+
+    Args:
+        model: Friendly model name or full model ID
+
+    Returns:
+        Full model ID; unknown names are returned unchanged
+    """
+    return _MODEL_RESOLVE(model.lower(), model)
+
+
+@functools.lru_cache(maxsize=None)
+def _breaker(model_id: str) -> CircuitBreaker:
+    """Return the circuit breaker for a Claude model ID"""
+    return CircuitBreaker(model_id, failure_types=TRANSIENT_ERRORS)
+
+
+@functools.lru_cache(maxsize=None)
+def _anthropic_client(api_key: str) -> anthropic.Anthropic:
+    """Return a shared Anthropic SDK client (and connection pool) per API key"""
+    return anthropic.Anthropic(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_client() -> ClaudeClient:
+    """Return the ClaudeClient used by call_claude, created on first use"""
+    return ClaudeClient()
+
+
 # Convenience function for backward compatibility
 def call_claude(messages: List[Message], model: str = "claude-sonnet-4-5-20250929") -> str:
     """
@@ -149,5 +264,18 @@ def call_claude(messages: List[Message], model: str = "claude-sonnet-4-5-2025092
     Returns:
         The model's response text
     """
-    client = ClaudeClient()
-    return client.call(messages, model=model)
+    return _default_client().call(messages, model=model)
+
+
+def stream_claude(messages: List[Message], model: str = "claude-sonnet-4-5-20250929") -> Iterator[str]:
+    """
+    Stream a Claude response piece by piece
+
+    Args:
+        messages: List of conversation messages
+        model: Model to use
+
+    Yields:
+        Successive pieces of the model's response text
+    """
+    return _default_client().stream(messages, model=model)
@@ -7,19 +7,28 @@ with advanced reasoning capabilities.
 """
 
 import os
-from typing import List, Optional
-from dataclasses import dataclass
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 
+from ._types import Message
+from .resilience import CircuitBreaker, retry, retry_stream
 
-@dataclass
-class Message:
-    """Represents a single message in a conversation"""
-    role: str  # 'user' or 'assistant'
-    content: str
-    timestamp: str
-    model: Optional[str] = None
-    metadata: Optional[dict] = None
+
+# Upper bound on concurrent file uploads/deletions per call
+MAX_FILE_WORKERS = 8
+
+# Errors worth retrying: rate limits, timeouts and server-side errors
+TRANSIENT_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+)
+
+_BREAKER = CircuitBreaker('gemini-2.5-pro', failure_types=TRANSIENT_ERRORS)
 
 
 class GeminiClient:
@@ -36,8 +45,10 @@ class GeminiClient:
         if not self.api_key:
             raise ValueError("Google API key not provided and GEMINI_API_KEY environment variable not set")
 
-        # Configure the API key
-        genai.configure(api_key=self.api_key)
+        # Configure the API key. REST rather than the default gRPC transport:
+        # gRPC blocks in native code, which would stall the whole eventlet
+        # hub for the length of each call when the server runs under eventlet
+        genai.configure(api_key=self.api_key, transport='rest')
 
     def call(
         self,
@@ -59,7 +70,9 @@ class GeminiClient:
             The model's response text
 
         Raises:
-            Exception: If the API call fails
+            google.api_core.exceptions.GoogleAPIError: If the API call fails
+                (transient errors are retried first)
+            CircuitOpenError: If Gemini has been failing repeatedly
         """
         uploaded_files = []
 
@@ -68,50 +81,106 @@ class GeminiClient:
             if file_paths:
                 uploaded_files = self._upload_files(file_paths)
 
-            # Configure generation parameters
+            # Gemini 2.5 Pro, reused across calls with the same parameters
             # Note: Gemini 2.5 Pro automatically uses advanced reasoning capabilities
-            generation_config_dict = {}
-
-            # Add optional parameters
-            if max_tokens:
-                generation_config_dict['max_output_tokens'] = max_tokens
-            if temperature is not None:
-                generation_config_dict['temperature'] = temperature
-
-            # Initialize Gemini 2.5 Pro
-            if generation_config_dict:
-                model = genai.GenerativeModel(
-                    'gemini-2.5-pro',
-                    generation_config=genai.types.GenerationConfig(**generation_config_dict)
-                )
-            else:
-                # Use default configuration if no custom parameters
-                model = genai.GenerativeModel('gemini-2.5-pro')
-
-            # Prepare content parts
-            content_parts = []
-
-            # Add uploaded files first
-            for uploaded_file in uploaded_files:
-                content_parts.append(uploaded_file)
-
-            # Format and add the conversation messages
-            formatted_prompt = self._format_messages(messages)
-            content_parts.append(formatted_prompt)
+            model = _generative_model(max_tokens, temperature, self._system_instruction(messages))
 
             # Generate content with maximum reasoning
-            response = model.generate_content(content_parts)
+            response = self._generate(model, self._content_parts(messages, uploaded_files))
 
             # Extract response text
             return response.text
 
-        except Exception as e:
-            return f"Error calling Gemini 2.5 Pro: {str(e)}"
+        finally:
+            # Clean up uploaded files
+            self._cleanup_files(uploaded_files)
+
+    def stream(
+        self,
+        messages: List[Message],
+        file_paths: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> Iterator[str]:
+        """
+        Call Gemini 2.5 Pro, yielding the response text as it is generated
+
+        Args:
+            messages: List of conversation messages
+            file_paths: Optional list of file paths to upload and analyze
+            max_tokens: Maximum tokens in response (optional)
+            temperature: Sampling temperature (optional)
+
+        Yields:
+            Successive pieces of the model's response text
+
+        Raises:
+            google.api_core.exceptions.GoogleAPIError: If the API call fails
+                (transient errors are retried until the first piece has been
+                yielded, not after, since part of the response may already
+                have been relayed)
+            CircuitOpenError: If Gemini has been failing repeatedly
+        """
+        uploaded_files = []
+
+        try:
+            if file_paths:
+                uploaded_files = self._upload_files(file_paths)
+
+            model = _generative_model(max_tokens, temperature, self._system_instruction(messages))
+            content_parts = self._content_parts(messages, uploaded_files)
+            yield from retry_stream(lambda: self._generate_stream(model, content_parts), TRANSIENT_ERRORS)
 
         finally:
             # Clean up uploaded files
             self._cleanup_files(uploaded_files)
 
+    @retry(TRANSIENT_ERRORS)
+    def _generate(self, model, content_parts: List):
+        """
+        Generate a response, retrying transient errors
+
+        Args:
+            model: genai.GenerativeModel to call
+            content_parts: generate_content input
+
+        Returns:
+            The generate_content response
+        """
+        with _BREAKER:
+            return model.generate_content(content_parts)
+
+    def _generate_stream(self, model, content_parts: List) -> Iterator[str]:
+        """
+        Generate a streamed response
+
+        Args:
+            model: genai.GenerativeModel to call
+            content_parts: generate_content input
+
+        Yields:
+            Successive pieces of the response text
+        """
+        with _BREAKER:
+            for chunk in model.generate_content(content_parts, stream=True):
+                if chunk.parts:
+                    yield chunk.text
+
+    def _content_parts(self, messages: List[Message], uploaded_files: List) -> List:
+        """
+        Build the generate_content input: uploaded files first, then the conversation
+
+        Args:
+            messages: List of conversation messages
+            uploaded_files: Files already uploaded for this call
+
+        Returns:
+            List of content parts
+        """
+        content_parts = list(uploaded_files)
+        content_parts.append(self._format_messages(messages))
+        return content_parts
+
     def _upload_files(self, file_paths: List[str]) -> List:
         """
         Upload files to Gemini for analysis
@@ -122,20 +191,52 @@ class GeminiClient:
         Returns:
             List of uploaded file objects
         """
-        uploaded_files = []
-
+        existing_paths = []
         for file_path in file_paths:
             if os.path.exists(file_path):
-                try:
-                    uploaded_file = genai.upload_file(file_path)
-                    uploaded_files.append(uploaded_file)
-                    print(f"Uploaded file: {file_path} -> {uploaded_file.name}")
-                except Exception as e:
-                    print(f"Warning: Failed to upload file {file_path}: {str(e)}")
+                existing_paths.append(file_path)
             else:
                 print(f"Warning: File not found: {file_path}")
 
-        return uploaded_files
+        if not existing_paths:
+            return []
+
+        # Uploads are network-bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(existing_paths), MAX_FILE_WORKERS)) as executor:
+            results = list(executor.map(self._upload_file, existing_paths))
+
+        return [uploaded_file for uploaded_file in results if uploaded_file is not None]
+
+    def _upload_file(self, file_path: str):
+        """
+        Upload a single file, returning None if the upload fails
+
+        Args:
+            file_path: Path of the file to upload
+
+        Returns:
+            Uploaded file object or None
+        """
+        try:
+            uploaded_file = genai.upload_file(file_path)
+            print(f"Uploaded file: {file_path} -> {uploaded_file.name}")
+            return uploaded_file
+        except Exception as e:
+            print(f"Warning: Failed to upload file {file_path}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _system_instruction(messages: List[Message]) -> Optional[str]:
+        """
+        Combine the system messages into a system instruction
+
+        Args:
+            messages: List of Message objects
+
+        Returns:
+            System instruction text, or None if there are no system messages
+        """
+        return "\n\n".join(msg.content for msg in messages if msg.role == "system") or None
 
     def _format_messages(self, messages: List[Message]) -> str:
         """
@@ -147,15 +248,15 @@ class GeminiClient:
         Returns:
             Formatted prompt string
         """
-        formatted_prompt = ""
+        parts = []
 
         for msg in messages:
             if msg.role == "user":
-                formatted_prompt += f"User: {msg.content}\n\n"
+                parts.append(f"User: {msg.content}\n\n")
             elif msg.role == "assistant":
-                formatted_prompt += f"Assistant: {msg.content}\n\n"
+                parts.append(f"Assistant: {msg.content}\n\n")
 
-        return formatted_prompt.strip()
+        return "".join(parts).strip()
 
     def _cleanup_files(self, uploaded_files: List):
         """
@@ -164,13 +265,63 @@ class GeminiClient:
         Args:
             uploaded_files: List of uploaded file objects to delete
         """
-        for uploaded_file in uploaded_files:
-            try:
-                genai.delete_file(uploaded_file.name)
-                print(f"Cleaned up file: {uploaded_file.name}")
-            except Exception as e:
-                # Ignore cleanup errors - files auto-expire after 48 hours
-                print(f"Warning: Failed to delete file {uploaded_file.name}: {str(e)}")
+        if not uploaded_files:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(uploaded_files), MAX_FILE_WORKERS)) as executor:
+            executor.map(self._delete_file, uploaded_files)
+
+    def _delete_file(self, uploaded_file):
+        """
+        Delete a single uploaded file, ignoring failures
+
+        Args:
+            uploaded_file: Uploaded file object to delete
+        """
+        try:
+            genai.delete_file(uploaded_file.name)
+            print(f"Cleaned up file: {uploaded_file.name}")
+        except Exception as e:
+            # Ignore cleanup errors - files auto-expire after 48 hours
+            print(f"Warning: Failed to delete file {uploaded_file.name}: {str(e)}")
+
+
+@functools.lru_cache(maxsize=32)
+def _generative_model(max_tokens: Optional[int], temperature: Optional[float],
+                      system_instruction: Optional[str] = None):
+    """
+    Return a shared Gemini 2.5 Pro model for a generation configuration
+
+    Args:
+        max_tokens: Maximum tokens in response (optional)
+        temperature: Sampling temperature (optional)
+        system_instruction: System instruction (optional)
+
+    Returns:
+        genai.GenerativeModel instance
+    """
+    generation_config_dict = {}
+
+    # Add optional parameters
+    if max_tokens:
+        generation_config_dict['max_output_tokens'] = max_tokens
+    if temperature is not None:
+        generation_config_dict['temperature'] = temperature
+
+    if generation_config_dict:
+        return genai.GenerativeModel(
+            'gemini-2.5-pro',
+            generation_config=genai.types.GenerationConfig(**generation_config_dict),
+            system_instruction=system_instruction
+        )
+    # Use default configuration if no custom parameters
+    return genai.GenerativeModel('gemini-2.5-pro', system_instruction=system_instruction)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_client() -> GeminiClient:
+    """Return the GeminiClient used by call_gemini, created on first use"""
+    return GeminiClient()
 
 
 # Convenience function for backward compatibility
@@ -188,5 +339,21 @@ def call_gemini(
     Returns:
         The model's response text
     """
-    client = GeminiClient()
-    return client.call(messages, file_paths=file_paths)
+    return _default_client().call(messages, file_paths=file_paths)
+
+
+def stream_gemini(
+    messages: List[Message],
+    file_paths: Optional[List[str]] = None
+) -> Iterator[str]:
+    """
+    Stream a Gemini 2.5 Pro response piece by piece
+
+    Args:
+        messages: List of conversation messages
+        file_paths: Optional list of file paths to upload and analyze
+
+    Yields:
+        Successive pieces of the model's response text
+    """
+    return _default_client().stream(messages, file_paths=file_paths)
@@ -6,19 +6,11 @@ Handles all interactions with OpenAI's GPT-5 and GPT-5 Pro models.
 """
 
 import os
-from typing import List, Optional
-from dataclasses import dataclass
-from openai import OpenAI
+import functools
+from typing import Iterator, List, Optional
 
-
-@dataclass
-class Message:
-    """Represents a single message in a conversation"""
-    role: str  # 'user' or 'assistant'
-    content: str
-    timestamp: str
-    model: Optional[str] = None
-    metadata: Optional[dict] = None
+from ._http import openai_client
+from ._types import Message
 
 
 class GPT5Client:
@@ -35,7 +27,7 @@ class GPT5Client:
         if not self.api_key:
             raise ValueError("OpenAI API key not provided and OPENAI_API_KEY environment variable not set")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = openai_client(self.api_key)
 
     def call(
         self,
@@ -63,23 +55,54 @@ class GPT5Client:
             Temperature parameter is not supported by reasoning models.
             The reasoning process requires deterministic behavior.
         """
-        try:
-            # Convert messages to OpenAI format
-            formatted_messages = self._format_messages(messages)
+        # Convert messages to OpenAI format
+        formatted_messages = self._format_messages(messages)
+
+        # Use Responses API which supports reasoning parameter
+        # Note: temperature is NOT supported with reasoning models
+        response = self.client.responses.create(
+            model=model,
+            reasoning={"effort": reasoning_effort},
+            input=formatted_messages,
+            max_output_tokens=max_output_tokens
+        )
+
+        return response.output_text
+
+    def stream(
+        self,
+        messages: List[Message],
+        model: str = "gpt-5-pro",
+        max_output_tokens: int = 4000,
+        reasoning_effort: str = "high"
+    ) -> Iterator[str]:
+        """
+        Call GPT-5 or GPT-5 Pro, yielding the response text as it is generated
 
-            # Use Responses API which supports reasoning parameter
-            # Note: temperature is NOT supported with reasoning models
-            response = self.client.responses.create(
-                model=model,
-                reasoning={"effort": reasoning_effort},
-                input=formatted_messages,
-                max_output_tokens=max_output_tokens
-            )
+        Args:
+            messages: List of conversation messages
+            model: Model to use (gpt-5, gpt-5-pro, etc.)
+            max_output_tokens: Maximum tokens in response
+            reasoning_effort: Effort level for reasoning (high, medium, low, minimal)
 
-            return response.output_text
+        Yields:
+            Successive pieces of the model's response text
 
-        except Exception as e:
-            return f"Error calling GPT model: {str(e)}"
+        Raises:
+            openai.APIError: If the API call fails
+        """
+        events = self.client.responses.create(
+            model=model,
+            reasoning={"effort": reasoning_effort},
+            input=self._format_messages(messages),
+            max_output_tokens=max_output_tokens,
+            stream=True
+        )
+        for event in events:
+            if event.type == "response.output_text.delta":
+                yield event.delta
+            elif event.type in ("error", "response.failed"):
+                raise RuntimeError(f"GPT response stream failed: {getattr(event, 'message', event.type)}")
 
     def _format_messages(self, messages: List[Message]) -> List[dict]:
         """
@@ -91,13 +114,13 @@ class GPT5Client:
         Returns:
             List of message dictionaries in OpenAI format
         """
-        formatted = []
-        for msg in messages:
-            formatted.append({
-                "role": msg.role,
-                "content": msg.content
-            })
-        return formatted
+        return [{"role": msg.role, "content": msg.content} for msg in messages]
+
+
+@functools.lru_cache(maxsize=1)
+def _default_client() -> GPT5Client:
+    """Return the GPT5Client used by call_gpt5, created on first use"""
+    return GPT5Client()
 
 
 # Convenience function for backward compatibility
@@ -112,5 +135,18 @@ def call_gpt5(messages: List[Message], reasoning_effort: str = "high") -> str:
     Returns:
         The model's response text
     """
-    client = GPT5Client()
-    return client.call(messages, reasoning_effort=reasoning_effort)
+    return _default_client().call(messages, reasoning_effort=reasoning_effort)
+
+
+def stream_gpt5(messages: List[Message], reasoning_effort: str = "high") -> Iterator[str]:
+    """
+    Stream a GPT-5 response piece by piece
+
+    Args:
+        messages: List of conversation messages
+        reasoning_effort: Effort level for reasoning
+
+    Yields:
+        Successive pieces of the model's response text
+    """
+    return _default_client().stream(messages, reasoning_effort=reasoning_effort)
@@ -6,31 +6,41 @@ Handles all interactions with xAI's Grok models including Grok-4-Fast-Reasoning.
 """
 
 import os
-from typing import List, Optional
-from dataclasses import dataclass
+import functools
+import importlib.util
+from typing import Iterator, List, Optional
+
+from ._http import openai_client
+from ._types import Message
+
+# Prefer the xAI SDK, fallback to OpenAI for compatibility. Only check that
+# it is installed here; it is imported when a client is first created.
+USE_XAI_SDK = importlib.util.find_spec("xai_sdk") is not None
 
-# Try importing xAI SDK, fallback to OpenAI for compatibility
 try:
-    from xai_sdk import Client as XAIClient
-    from xai_sdk.chat import system as xai_system, user as xai_user, assistant as xai_assistant
-    USE_XAI_SDK = True
+    from eventlet import patcher, tpool
 except ImportError:
-    # Fallback to OpenAI SDK with custom base URL (xAI is OpenAI-compatible)
-    try:
-        from openai import OpenAI
-        USE_XAI_SDK = False
-    except ImportError:
-        raise ImportError("Neither xai-sdk nor openai package found. Please install with: pip install xai-sdk")
+    patcher = tpool = None
 
 
-@dataclass
-class Message:
-    """Represents a single message in a conversation"""
-    role: str  # 'user', 'assistant', or 'system'
-    content: str
-    timestamp: str
-    model: Optional[str] = None
-    metadata: Optional[dict] = None
+def _blocking(func, *args):
+    """
+    Run a call that blocks in native code
+
+    The xAI SDK talks gRPC, which cannot yield to eventlet; when the server
+    runs under eventlet the call goes to eventlet's OS thread pool so the
+    hub keeps serving other requests and sockets meanwhile.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    if tpool is not None and patcher.is_monkey_patched('socket'):
+        return tpool.execute(func, *args)
+    return func(*args)
 
 
 class GrokClient:
@@ -61,14 +71,15 @@ class GrokClient:
 
         if USE_XAI_SDK:
             # Use native xAI SDK
+            from xai_sdk import Client as XAIClient
             self.client = XAIClient(api_key=self.api_key)
             self.use_native = True
         else:
-            # Use OpenAI SDK with xAI base URL (OpenAI-compatible)
-            self.client = OpenAI(
-                api_key=self.api_key,
-                base_url="https://api.x.ai/v1"
-            )
+            # Fallback to OpenAI SDK with xAI base URL (OpenAI-compatible)
+            try:
+                self.client = openai_client(self.api_key, base_url="https://api.x.ai/v1")
+            except ImportError:
+                raise ImportError("Neither xai-sdk nor openai package found. Please install with: pip install xai-sdk")
             self.use_native = False
 
     def call(
@@ -97,19 +108,60 @@ class GrokClient:
         Raises:
             Exception: If the API call fails
         """
-        try:
-            # Map friendly model names to full model IDs
-            resolved_model = self.MODEL_MAP.get(model, model)
+        # Map friendly model names to full model IDs
+        resolved_model = _MODEL_RESOLVE(model, model)
 
-            if self.use_native and USE_XAI_SDK:
-                # Use native xAI SDK with chat sessions
-                return self._call_native_sdk(messages, resolved_model, max_tokens, temperature, system_prompt)
-            else:
-                # Use OpenAI-compatible API
-                return self._call_openai_compatible(messages, resolved_model, max_tokens, temperature, system_prompt)
+        if self.use_native and USE_XAI_SDK:
+            # Use native xAI SDK with chat sessions
+            return self._call_native_sdk(messages, resolved_model, max_tokens, temperature, system_prompt)
+        else:
+            # Use OpenAI-compatible API
+            return self._call_openai_compatible(messages, resolved_model, max_tokens, temperature, system_prompt)
 
-        except Exception as e:
-            return f"Error calling Grok: {str(e)}"
+    def stream(
+        self,
+        messages: List[Message],
+        model: str = "grok-4-fast-reasoning",
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Call Grok API, yielding the response text as it is generated
+
+        Args:
+            messages: List of conversation messages
+            model: Model to use (can use friendly names like 'grok' or full model IDs)
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature (0.0 to 2.0)
+            system_prompt: Optional system prompt to prepend
+
+        Yields:
+            Successive pieces of the model's response text
+
+        Raises:
+            Exception: If the API call fails
+        """
+        resolved_model = _MODEL_RESOLVE(model, model)
+
+        if self.use_native and USE_XAI_SDK:
+            chunks = self._native_chat(messages, resolved_model, system_prompt).stream()
+            # Each step of the gRPC stream blocks, so fetch them one by one
+            while (item := _blocking(next, chunks, None)) is not None:
+                _, chunk = item
+                if chunk.content:
+                    yield chunk.content
+        else:
+            chunks = self.client.chat.completions.create(
+                model=resolved_model,
+                messages=self._format_messages(messages, system_prompt),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+            for chunk in chunks:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
 
     def _call_native_sdk(
         self,
@@ -120,36 +172,28 @@ class GrokClient:
         system_prompt: Optional[str]
     ) -> str:
         """Call using native xAI SDK"""
-        # Create initial messages list
-        initial_messages = []
+        chat = self._native_chat(messages, model, system_prompt)
 
-        # Add system prompt if provided
-        if system_prompt:
-            initial_messages.append(xai_system(system_prompt))
+        # Sample response
+        response = _blocking(chat.sample)
+        return response.content
 
-        # Extract system messages from conversation
-        system_messages = [msg for msg in messages if msg.role == 'system']
-        for sys_msg in system_messages:
-            initial_messages.append(xai_system(sys_msg.content))
+    def _native_chat(self, messages: List[Message], model: str, system_prompt: Optional[str]):
+        """Create a native xAI SDK chat holding the full conversation"""
+        from xai_sdk.chat import system as xai_system, user as xai_user, assistant as xai_assistant
 
-        # Create chat session
-        chat = self.client.chat.create(
-            model=model,
-            messages=initial_messages if initial_messages else []
-        )
+        # System prompts first, then the conversation, in a single create call
+        system_prompts = [system_prompt] if system_prompt else []
+        system_prompts += [msg.content for msg in messages if msg.role == 'system']
 
-        # Add user and assistant messages
-        for msg in messages:
-            if msg.role == 'system':
-                continue  # Already added
-            elif msg.role == 'user':
-                chat.append(xai_user(msg.content))
-            elif msg.role == 'assistant':
-                chat.append(xai_assistant(msg.content))
+        all_messages = [xai_system(prompt) for prompt in system_prompts]
+        all_messages += [
+            xai_user(msg.content) if msg.role == 'user' else xai_assistant(msg.content)
+            for msg in messages
+            if msg.role in ('user', 'assistant')
+        ]
 
-        # Sample response
-        response = chat.sample()
-        return response.content
+        return self.client.chat.create(model=model, messages=all_messages)
 
     def _call_openai_compatible(
         self,
@@ -185,22 +229,9 @@ class GrokClient:
         Returns:
             List of message dictionaries in API format
         """
-        formatted = []
-
         # Add system prompt if provided
-        if system_prompt:
-            formatted.append({
-                "role": "system",
-                "content": system_prompt
-            })
-
-        # Add conversation messages
-        for msg in messages:
-            formatted.append({
-                "role": msg.role,
-                "content": msg.content
-            })
-
+        formatted = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        formatted += [{"role": msg.role, "content": msg.content} for msg in messages]
         return formatted
 
     def get_model_info(self, model: str = "grok") -> dict:
@@ -213,7 +244,7 @@ class GrokClient:
         Returns:
             Dictionary with model information
         """
-        resolved_model = self.MODEL_MAP.get(model, model)
+        resolved_model = _MODEL_RESOLVE(model, model)
 
         # Model capabilities info
         model_info = {
@@ -229,6 +260,16 @@ class GrokClient:
         return model_info
 
 
+# Module-level bound lookup: no attribute or class dict traversal per request
+_MODEL_RESOLVE = dict(GrokClient.MODEL_MAP).get
+
+
+@functools.lru_cache(maxsize=1)
+def _default_client() -> GrokClient:
+    """Return the GrokClient used by call_grok, created on first use"""
+    return GrokClient()
+
+
 # Convenience function for backward compatibility
 def call_grok(
     messages: List[Message],
@@ -248,5 +289,18 @@ def call_grok(
     Returns:
         The model's response text
     """
-    client = GrokClient()
-    return client.call(messages, model=model, temperature=temperature, max_tokens=max_tokens)
+    return _default_client().call(messages, model=model, temperature=temperature, max_tokens=max_tokens)
+
+
+def stream_grok(messages: List[Message], model: str = "grok-4-fast-reasoning") -> Iterator[str]:
+    """
+    Stream a Grok response piece by piece
+
+    Args:
+        messages: List of conversation messages
+        model: Model to use (default: grok-4-fast-reasoning)
+
+    Yields:
+        Successive pieces of the model's response text
+    """
+    return _default_client().stream(messages, model=model)
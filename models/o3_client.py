@@ -7,19 +7,22 @@ Supports file uploads and configurable reasoning effort levels.
 """
 
 import os
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
-from dataclasses import dataclass
-from openai import OpenAI
 
+from ._http import openai_client
+from ._types import Message
 
-@dataclass
-class Message:
-    """Represents a single message in a conversation"""
-    role: str  # 'user' or 'assistant'
-    content: str
-    timestamp: str
-    model: Optional[str] = None
-    metadata: Optional[dict] = None
+
+# Upper bound on concurrent file uploads/deletes per request
+MAX_FILE_WORKERS = 8
+
+# Deletes uploaded files in the background so callers never wait on cleanup
+_CLEANUP_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_FILE_WORKERS, thread_name_prefix='o3-cleanup')
+
+# Prompt prefix for each role included in the combined prompt
+ROLE_LABELS = {"user": "User", "assistant": "Assistant"}
 
 
 class O3Client:
@@ -36,7 +39,7 @@ class O3Client:
         if not self.api_key:
             raise ValueError("OpenAI API key not provided and OPENAI_API_KEY environment variable not set")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = openai_client(self.api_key)
 
     def call(
         self,
@@ -79,28 +82,32 @@ class O3Client:
             # Add the combined prompt as input text
             content.append({"type": "input_text", "text": combined_prompt})
 
-            # Call o3-pro with the specified effort level
-            response = self.client.responses.create(
-                model="o3-pro",
-                reasoning={"effort": reasoning_effort},
-                input=[
+            request = {
+                "model": "o3-pro",
+                "reasoning": {"effort": reasoning_effort},
+                "input": [
                     {
                         "role": "user",
                         "content": content
                     }
                 ]
-            )
+            }
+
+            # System messages become the request's instructions
+            instructions = "\n\n".join(msg.content for msg in messages if msg.role == "system")
+            if instructions:
+                request["instructions"] = instructions
+
+            # Call o3-pro with the specified effort level
+            response = self.client.responses.create(**request)
 
             # Extract text from the response
             result = self._extract_response_text(response)
 
             return result
 
-        except Exception as e:
-            return f"Error calling o3-pro: {str(e)}"
-
         finally:
-            # Clean up uploaded files
+            # Clean up uploaded files off the request path
             self._cleanup_files(uploaded_files)
 
     def _upload_files(self, file_paths: List[str]) -> List:
@@ -113,23 +120,41 @@ class O3Client:
         Returns:
             List of uploaded file objects
         """
-        uploaded_files = []
-
+        existing_paths = []
         for file_path in file_paths:
             if os.path.exists(file_path):
-                try:
-                    with open(file_path, "rb") as f:
-                        uploaded = self.client.files.create(
-                            file=f,
-                            purpose="user_data"
-                        )
-                        uploaded_files.append(uploaded)
-                except Exception as e:
-                    print(f"Warning: Failed to upload file {file_path}: {str(e)}")
+                existing_paths.append(file_path)
             else:
                 print(f"Warning: File not found: {file_path}")
 
-        return uploaded_files
+        if not existing_paths:
+            return []
+
+        # Uploads are network-bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(existing_paths), MAX_FILE_WORKERS)) as executor:
+            results = list(executor.map(self._upload_file, existing_paths))
+
+        return [uploaded for uploaded in results if uploaded is not None]
+
+    def _upload_file(self, file_path: str):
+        """
+        Upload a single file, returning None if the upload fails
+
+        Args:
+            file_path: Path of the file to upload
+
+        Returns:
+            Uploaded file object or None
+        """
+        try:
+            with open(file_path, "rb") as f:
+                return self.client.files.create(
+                    file=f,
+                    purpose="user_data"
+                )
+        except Exception as e:
+            print(f"Warning: Failed to upload file {file_path}: {str(e)}")
+            return None
 
     def _combine_messages(self, messages: List[Message]) -> str:
         """
@@ -141,14 +166,12 @@ class O3Client:
         Returns:
             Combined prompt string
         """
-        combined_prompt = ""
-        for msg in messages:
-            if msg.role == "user":
-                combined_prompt += f"User: {msg.content}\n\n"
-            elif msg.role == "assistant":
-                combined_prompt += f"Assistant: {msg.content}\n\n"
-
-        return combined_prompt.strip()
+        parts = [
+            f"{ROLE_LABELS[msg.role]}: {msg.content}\n\n"
+            for msg in messages
+            if msg.role in ROLE_LABELS
+        ]
+        return "".join(parts).strip()
 
     def _extract_response_text(self, response) -> str:
         """
@@ -160,28 +183,42 @@ class O3Client:
         Returns:
             Extracted text content
         """
-        output_text = []
-        for item in response.output:
-            if getattr(item, "content", None):
-                for c in item.content:
-                    if getattr(c, "text", None):
-                        output_text.append(c.text)
-
-        return "".join(output_text)
+        return "".join(
+            c.text
+            for item in response.output
+            if getattr(item, "content", None)
+            for c in item.content
+            if getattr(c, "text", None)
+        )
 
     def _cleanup_files(self, uploaded_files: List):
         """
-        Delete uploaded files from OpenAI
+        Schedule deletion of uploaded files from OpenAI without waiting for it
 
         Args:
             uploaded_files: List of uploaded file objects to delete
         """
         for uploaded in uploaded_files:
-            try:
-                self.client.files.delete(uploaded.id)
-            except Exception as e:
-                # Ignore cleanup errors - files will auto-expire
-                print(f"Warning: Failed to delete file {uploaded.id}: {str(e)}")
+            _CLEANUP_EXECUTOR.submit(self._delete_file, uploaded)
+
+    def _delete_file(self, uploaded):
+        """
+        Delete a single uploaded file, ignoring failures
+
+        Args:
+            uploaded: Uploaded file object to delete
+        """
+        try:
+            self.client.files.delete(uploaded.id)
+        except Exception as e:
+            # Ignore cleanup errors - files will auto-expire
+            print(f"Warning: Failed to delete file {uploaded.id}: {str(e)}")
+
+
+@functools.lru_cache(maxsize=1)
+def _default_client() -> O3Client:
+    """Return the O3Client used by call_o3_pro, created on first use"""
+    return O3Client()
 
 
 # Convenience function for backward compatibility
@@ -201,5 +238,4 @@ def call_o3_pro(
     Returns:
         The model's response text
     """
-    client = O3Client()
-    return client.call(messages, reasoning_effort=reasoning_effort, file_paths=file_paths)
+    return _default_client().call(messages, reasoning_effort=reasoning_effort, file_paths=file_paths)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Resilience Helpers
+==================
+Retry with exponential backoff and a simple circuit breaker for model API calls.
+"""
+
+import time
+import random
+import functools
+import threading
+from typing import Callable, Iterator, Tuple, Type
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing provider for a while after repeated failures.
+
+    Use as a context manager around the call. After fail_max consecutive
+    failures the breaker opens and rejects calls with CircuitOpenError for
+    reset_timeout seconds; the next call after that is let through, and its
+    outcome closes or re-opens the breaker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = 5,
+        reset_timeout: float = 30.0,
+        failure_types: Tuple[Type[BaseException], ...] = (Exception,)
+    ):
+        """
+        Initialize the circuit breaker
+
+        Args:
+            name: Name used in error messages (e.g. the model ID)
+            fail_max: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before allowing a trial call
+            failure_types: Exception types that count as failures
+        """
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failure_types = failure_types
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            if self._failures >= self.fail_max:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"{self.name} is unavailable after repeated failures; retry in {remaining:.0f}s"
+                    )
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self._lock:
+            if exc_type is None:
+                self._failures = 0
+            elif issubclass(exc_type, self.failure_types):
+                self._failures += 1
+                if self._failures >= self.fail_max:
+                    self._opened_at = time.monotonic()
+        return False
+
+
+def retry(
+    retry_on: Tuple[Type[BaseException], ...],
+    attempts: int = 4,
+    base_delay: float = 1.0,
+    max_delay: float = 8.0
+) -> Callable:
+    """
+    Decorator that retries a function on transient errors
+
+    Delays grow exponentially (base_delay, 2x, 4x, ... capped at max_delay)
+    with random jitter so concurrent callers don't retry in lockstep.
+
+    Args:
+        retry_on: Exception types worth retrying
+        attempts: Total number of attempts, including the first
+        base_delay: Delay in seconds before the first retry
+        max_delay: Upper bound on any single delay
+
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except retry_on:
+                    if attempt == attempts:
+                        raise
+                    _backoff(attempt, base_delay, max_delay)
+        return wrapper
+    return decorator
+
+
+def retry_stream(
+    open_stream: Callable[[], Iterator],
+    retry_on: Tuple[Type[BaseException], ...],
+    attempts: int = 4,
+    base_delay: float = 1.0,
+    max_delay: float = 8.0
+) -> Iterator:
+    """
+    Iterate over a stream, retrying transient errors until its first item
+
+    Nothing has been passed on before the first item, so a failed stream
+    can still be reopened from scratch; once an item has been yielded,
+    errors propagate. Delays are the same as for retry().
+
+    Args:
+        open_stream: Opens the stream, returning an iterator over it
+        retry_on: Exception types worth retrying
+        attempts: Total number of attempts, including the first
+        base_delay: Delay in seconds before the first retry
+        max_delay: Upper bound on any single delay
+
+    Yields:
+        The items of the stream
+    """
+    for attempt in range(1, attempts + 1):
+        stream = open_stream()
+        try:
+            first = next(stream)
+        except StopIteration:
+            return
+        except retry_on:
+            if attempt == attempts:
+                raise
+            _backoff(attempt, base_delay, max_delay)
+            continue
+        yield first
+        yield from stream
+        return
+
+
+def _backoff(attempt: int, base_delay: float, max_delay: float):
+    """Sleep before retrying after the given attempt, with exponential backoff and jitter"""
+    delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+    time.sleep(delay * random.uniform(0.5, 1.0))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Connection Warm-up
+==================
+Opens connections to every configured provider ahead of the first request,
+so DNS lookup and the TCP/TLS handshake are not paid on user time.
+"""
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from . import claude_client, gemini_client, gpt5_client, grok_client
+
+logger = logging.getLogger(__name__)
+
+
+# Warm-up requests should fail fast rather than retry
+WARMUP_TIMEOUT = 10.0
+
+
+def _warm_openai():
+    gpt5_client._default_client().client.with_options(
+        max_retries=0, timeout=WARMUP_TIMEOUT
+    ).models.list()
+
+
+def _warm_anthropic():
+    claude_client._default_client().client.with_options(
+        max_retries=0, timeout=WARMUP_TIMEOUT
+    ).models.list()
+
+
+def _warm_xai():
+    client = grok_client._default_client()
+    if client.use_native:
+        return  # The native SDK opens its own channel on first use
+    client.client.with_options(max_retries=0, timeout=WARMUP_TIMEOUT).models.list()
+
+
+def _warm_gemini():
+    gemini_client._default_client()
+    next(iter(gemini_client.genai.list_models()), None)
+
+
+PROVIDERS: Dict[str, Callable[[], None]] = {
+    'openai': _warm_openai,
+    'anthropic': _warm_anthropic,
+    'xai': _warm_xai,
+    'gemini': _warm_gemini,
+}
+
+
+def warmup() -> List[str]:
+    """
+    Send a cheap request (list models) to every provider concurrently
+
+    Providers without an API key or that fail to respond are skipped.
+
+    Returns:
+        Names of the providers whose connections were warmed
+    """
+    def attempt(item):
+        name, warm = item
+        try:
+            warm()
+            return name
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(PROVIDERS)) as executor:
+        return [name for name in executor.map(attempt, PROVIDERS.items()) if name]
+
+
+def keep_warm(interval: float = 0.0):
+    """
+    Warm provider connections now and, optionally, at a fixed interval
+
+    Args:
+        interval: Seconds between warm-ups; 0 warms once and returns
+    """
+    warmed = warmup()
+    if warmed:
+        logger.info("Warmed provider connections: %s", ', '.join(warmed))
+
+    while interval > 0:
+        time.sleep(interval)
+        warmup()
@@ -5,8 +5,9 @@ Manages XML-based prompt configuration for system prompts and templates.
 """
 
 import os
-import xml.etree.ElementTree as ET
-from typing import Optional
+import json
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 
 class PromptConfig:
@@ -20,7 +21,10 @@ class PromptConfig:
             config_file: Path to XML configuration file
         """
         self.config_file = config_file
-        self.prompts = {}
+        self.cache_file = f"{config_file}.cache.json"
+        # Read-only view, replaced wholesale on reload
+        self.prompts: Mapping[str, str] = MappingProxyType({})
+        self._mtime: Optional[float] = None
         self.load_config()
 
     def load_config(self):
@@ -28,16 +32,75 @@ class PromptConfig:
         if not os.path.exists(self.config_file):
             self.create_default_config()
 
-        tree = ET.parse(self.config_file)
-        root = tree.getroot()
+        # Nothing to do while the XML file is unchanged
+        xml_mtime = os.path.getmtime(self.config_file)
+        if xml_mtime == self._mtime:
+            return
 
-        for prompt_elem in root.findall('prompt'):
-            name = prompt_elem.get('name')
-            content = prompt_elem.text.strip()
-            self.prompts[name] = content
+        # Reuse the parsed prompts from the JSON cache while the XML is unchanged
+        prompts = self._read_cache(xml_mtime)
+        if prompts is None:
+            prompts = self._parse_config()
+            self._write_cache(xml_mtime, prompts)
+
+        self.prompts = MappingProxyType(prompts)
+        self._mtime = xml_mtime
+
+    def _parse_config(self) -> Dict[str, str]:
+        """
+        Parse prompts from the XML file, discarding each element once read.
+
+        Returns:
+            Prompts dictionary
+        """
+        import xml.etree.ElementTree as ET
+
+        prompts = {}
+        for _, elem in ET.iterparse(self.config_file):
+            if elem.tag == 'prompt':
+                prompts[elem.get('name')] = elem.text.strip()
+                elem.clear()
+        return prompts
+
+    def _read_cache(self, xml_mtime: float) -> Optional[Dict[str, str]]:
+        """
+        Read prompts from the JSON cache if it matches the XML file.
+
+        Args:
+            xml_mtime: Modification time of the XML configuration file
+
+        Returns:
+            Cached prompts dictionary, or None if missing or stale
+        """
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cache.get('mtime') != xml_mtime:
+            return None
+        return cache.get('prompts')
+
+    def _write_cache(self, xml_mtime: float, prompts: Dict[str, str]):
+        """
+        Write the parsed prompts to the JSON cache.
+
+        Args:
+            xml_mtime: Modification time of the XML file the prompts came from
+            prompts: Parsed prompts dictionary
+        """
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'mtime': xml_mtime, 'prompts': prompts}, f)
+        except OSError:
+            # Caching is best-effort; a read-only directory just means re-parsing
+            pass
 
     def create_default_config(self):
         """Create default XML configuration file with common prompts"""
+        import xml.etree.ElementTree as ET
+
         root = ET.Element('prompts')
 
         # Add clarification prompt
@@ -78,6 +141,5 @@ Consider edge cases and potential issues.
         return self.prompts.get(name)
 
     def reload_config(self):
-        """Reload configuration from disk"""
-        self.prompts = {}
+        """Reload configuration from disk if the XML file has changed"""
         self.load_config()
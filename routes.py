@@ -4,16 +4,402 @@ API Routes
 All Flask route handlers for the Model Router API.
 """
 
+import os
+import gzip
+import base64
+import time
+import hashlib
+import logging
+import functools
+import mimetypes
+from typing import Dict
 from datetime import datetime
-from dataclasses import asdict
-from flask import request, jsonify, render_template_string
+import jinja2
+from flask import request, jsonify, Response
+
+import fast_json
+from cache import LRUCacheBackend, cache_key
+from data_models import Message
+from llm_dispatcher import LLMDispatcher
+from semantic_cache import SemanticCache
 
 # Import model client functions from the models package
-from models import call_gpt5, call_o3_pro, call_claude, call_grok, call_gemini
+from models import (call_gpt5, call_o3_pro, call_claude, call_grok, call_gemini,
+                    stream_gpt5, stream_claude, stream_grok, stream_gemini)
 from web_interface import get_index_template
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds on the history sent to a provider per request
+MAX_CONTEXT_MESSAGES = 20
+MAX_CONTEXT_CHARS = 30_000
+
+# Fast model that summarizes the history dropped from the context window
+SUMMARY_MODEL = 'claude-haiku'
+# A failed summary call is retried after this delay, doubling per failure
+SUMMARY_RETRY_DELAY = 30.0
+SUMMARY_MAX_RETRY_DELAY = 900.0
+SUMMARY_INSTRUCTIONS = (
+    "Summarize the following part of a conversation in a short paragraph. "
+    "Keep the facts, decisions and open questions needed to continue it.\n\n"
+)
+
+def _handle_o3_pro(messages, model, data):
+    # O3-Pro uses maximum effort by default as requested
+    return call_o3_pro(messages, reasoning_effort='high', file_paths=data.get('file_paths', []))
+
+
+def _handle_gpt(messages, model, data):
+    return call_gpt5(messages, data.get('reasoning_effort', 'high'))
+
+
+def _handle_claude(messages, model, data):
+    # Friendly names ('claude', 'claude-opus', ...) are resolved by the client
+    return call_claude(messages, model)
+
+
+def _handle_grok(messages, model, data):
+    return call_grok(messages, model=model)
+
+
+def _handle_gemini(messages, model, data):
+    # Gemini 2.5 Pro with MAXIMUM reasoning power and file support
+    return call_gemini(messages, file_paths=data.get('file_paths', []))
+
+
+# Model dispatch table, keyed by exact model ID or by model family
+MODEL_HANDLERS = {
+    'o3-pro': _handle_o3_pro,
+    'gpt': _handle_gpt,
+    'claude': _handle_claude,
+    'grok': _handle_grok,
+    'gemini': _handle_gemini,
+}
+
+# Families matched by prefix (e.g. 'gpt5', 'gpt-5-pro' -> 'gpt'); other
+# keys only match their exact model ID
+MODEL_FAMILIES = ('gpt', 'claude', 'grok', 'gemini')
+
+
+def _stream_gpt(messages, model, data):
+    return stream_gpt5(messages, data.get('reasoning_effort', 'high'))
+
+
+def _stream_claude(messages, model, data):
+    return stream_claude(messages, model)
+
+
+def _stream_grok(messages, model, data):
+    return stream_grok(messages, model=model)
+
+
+def _stream_gemini(messages, model, data):
+    return stream_gemini(messages, file_paths=data.get('file_paths', []))
+
+
+# Families whose responses are streamed to the dashboard as they arrive
+STREAM_HANDLERS = {
+    'gpt': _stream_gpt,
+    'claude': _stream_claude,
+    'grok': _stream_grok,
+    'gemini': _stream_gemini,
+}
+
+
+class ChatRequestError(Exception):
+    """A chat request that cannot be served, with the HTTP status to answer with"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def sse_event(data, event: str = None) -> str:
+    """
+    Format a Server-Sent Events message.
+
+    Args:
+        data: JSON-serializable payload
+        event: Optional event name (clients default to 'message')
+
+    Returns:
+        The encoded event, terminated by a blank line
+    """
+    prefix = f"event: {event}\n" if event else ''
+    return f"{prefix}data: {fast_json.dumps(data)}\n\n"
+
+
+def context_window(messages, max_messages: int = MAX_CONTEXT_MESSAGES,
+                   max_chars: int = MAX_CONTEXT_CHARS):
+    """
+    Select the part of a conversation history to send to a model.
+
+    The first message (which sets up the conversation) is always kept,
+    followed by the most recent messages that fit within both limits.
+    The latest message is always included even if it alone exceeds
+    max_chars.
+
+    Args:
+        messages: Full list of conversation messages
+        max_messages: Maximum number of messages to send
+        max_chars: Maximum total content length to send
+
+    Returns:
+        List of messages to send
+    """
+    if len(messages) <= max_messages and sum(len(m.content) for m in messages) <= max_chars:
+        return messages
+
+    first = messages[0]
+    tail = messages[1:][-(max_messages - 1):]
+
+    # Drop the oldest tail messages until the character budget is met
+    budget = max_chars - len(first.content)
+    total = sum(len(m.content) for m in tail)
+    start = 0
+    while start < len(tail) - 1 and total > budget:
+        total -= len(tail[start].content)
+        start += 1
+    tail = tail[start:]
+
+    # Keep roles alternating after the pinned first message
+    if len(tail) > 1 and tail[0].role == first.role:
+        tail = tail[1:]
+
+    return [first] + tail
 
-def register_routes(app, conversation_manager, prompt_config):
+
+def build_context(conversation, llm_dispatcher, conversation_manager):
+    """
+    Select the messages to send for a conversation.
+
+    Applies context_window, and stands in a running summary for the older
+    messages it drops: the summary is appended to the pinned first message,
+    so roles keep alternating for every provider. When more messages have
+    been dropped than the summary covers, a new summary is requested in the
+    background and used from the next request on.
+
+    Args:
+        conversation: Conversation to build the context for
+        llm_dispatcher: LLMDispatcher that runs the summarization call
+        conversation_manager: ConversationManager that records the summary
+
+    Returns:
+        List of messages to send
+    """
+    with conversation.lock:
+        history = list(conversation.messages)
+        summary = conversation.summary
+        summary_upto = conversation.summary_upto
+
+    messages = context_window(history)
+    if len(messages) == len(history):
+        return messages
+
+    # history[1:dropped_end] fell outside the window
+    dropped_end = len(history) - len(messages) + 1
+    if dropped_end > summary_upto:
+        _refresh_summary(conversation, history[summary_upto:dropped_end], summary, dropped_end,
+                         llm_dispatcher, conversation_manager)
+
+    if summary:
+        first = messages[0]
+        messages[0] = Message(
+            role=first.role,
+            content=f"{first.content}\n\nSummary of the conversation since this message:\n{summary}",
+            timestamp=first.timestamp,
+            model=first.model
+        )
+    return messages
+
+
+def with_system_prompt(messages, system_prompt):
+    """
+    Put a system prompt in front of the messages sent to a model.
+
+    Each model client passes system messages through its provider's own
+    system prompt mechanism.
+
+    Args:
+        messages: List of messages to send
+        system_prompt: System prompt text, or None for no system prompt
+
+    Returns:
+        List of messages to send
+    """
+    if not system_prompt:
+        return messages
+    system = Message(role='system', content=system_prompt, timestamp=datetime.now().isoformat())
+    return [system] + messages
+
+
+def _refresh_summary(conversation, new_messages, summary, upto, llm_dispatcher, conversation_manager):
+    """
+    Fold newly dropped messages into the conversation summary in the background.
+
+    At most one summary call per conversation is in flight; after a failure
+    none is made until the retry delay has passed.
+
+    Args:
+        conversation: Conversation to update
+        new_messages: Messages not yet covered by the summary
+        summary: Current summary, or None
+        upto: History index the new summary covers up to (exclusive)
+        llm_dispatcher: LLMDispatcher that runs the summarization call
+        conversation_manager: ConversationManager that records the summary
+    """
+    with conversation.lock:
+        if conversation.summary_pending or time.monotonic() < conversation.summary_retry_at:
+            return
+        conversation.summary_pending = True
+
+    parts = [SUMMARY_INSTRUCTIONS]
+    if summary:
+        parts.append(f"Summary so far:\n{summary}\n\n")
+    parts += [f"{msg.role.capitalize()}: {msg.content}\n\n" for msg in new_messages]
+    request_messages = [Message(role='user', content=''.join(parts), timestamp=datetime.now().isoformat())]
+
+    def store(future):
+        error = future.exception()
+        with conversation.lock:
+            conversation.summary_pending = False
+            if error is not None:
+                # Keep the previous summary; retry later, backing off
+                conversation.summary_failures += 1
+                delay = SUMMARY_RETRY_DELAY * 2 ** (conversation.summary_failures - 1)
+                conversation.summary_retry_at = time.monotonic() + min(delay, SUMMARY_MAX_RETRY_DELAY)
+            else:
+                conversation.summary_failures = 0
+        if error is not None:
+            logger.warning("Summarizing conversation %s failed: %s", conversation.id, error)
+            return
+        conversation_manager.save_context_summary(conversation, future.result(), upto)
+
+    # Concurrent requests for the same update share one call
+    handler = resolve_model_handler(SUMMARY_MODEL)
+    llm_dispatcher.submit(handler, request_messages, SUMMARY_MODEL, {}).add_done_callback(store)
+
+
+# Socket.IO client: served from static/ when a copy has been placed there,
+# otherwise loaded from the CDN
+SOCKETIO_CLIENT = 'socket.io.min.js'
+SOCKETIO_CDN_URL = 'https://cdn.socket.io/4.5.0/socket.io.min.js'
+
+
+def subresource_integrity(path: str) -> str:
+    """
+    Compute the Subresource Integrity value of a static asset.
+
+    Args:
+        path: Path of the asset file
+
+    Returns:
+        'sha384-' followed by the base64 digest of the file contents
+    """
+    with open(path, 'rb') as f:
+        return 'sha384-' + base64.b64encode(hashlib.sha384(f.read()).digest()).decode('ascii')
+
+
+def asset_version(path: str) -> str:
+    """
+    Fingerprint a static asset for cache-busting URLs.
+
+    Args:
+        path: Path of the asset file
+
+    Returns:
+        Short hex digest of the file contents
+    """
+    with open(path, 'rb') as f:
+        return hashlib.md5(f.read(), usedforsecurity=False).hexdigest()[:12]
+
+
+def compress_variants(body: bytes) -> Dict[str, bytes]:
+    """
+    Precompress a fixed response body once for every supported encoding.
+
+    Args:
+        body: Uncompressed body
+
+    Returns:
+        Mapping of content coding ('identity', 'gzip' and, when the brotli
+        package is installed, 'br') to the encoded body
+    """
+    variants = {'identity': body, 'gzip': gzip.compress(body, 9, mtime=0)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=11)
+    return variants
+
+
+def precompressed_response(variants: Dict[str, bytes], mimetype: str, etag: str,
+                           last_modified: float) -> Response:
+    """
+    Answer with the best precompressed variant the client accepts.
+
+    Args:
+        variants: Encoded bodies from compress_variants
+        mimetype: Response content type
+        etag: Entity tag of the uncompressed body
+        last_modified: Unix time the body last changed
+
+    Returns:
+        Response with Content-Encoding, ETag, Last-Modified and Vary set
+    """
+    encoding = next(
+        (enc for enc in ('br', 'gzip') if enc in variants and request.accept_encodings[enc]),
+        'identity'
+    )
+    response = Response(variants[encoding], mimetype=mimetype)
+    if encoding == 'identity':
+        response.set_etag(etag)
+    else:
+        response.headers['Content-Encoding'] = encoding
+        response.set_etag(f'{etag}-{encoding}')
+    response.last_modified = last_modified
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+@functools.lru_cache(maxsize=256)
+def model_family(model: str):
+    """
+    Find the dispatch key for a model ID. Results are memoized per model
+    ID, so repeat requests skip the prefix scan.
+
+    Args:
+        model: Model identifier from the request
+
+    Returns:
+        The model ID itself if it has its own handler (e.g. 'o3-pro'), else
+        the family it starts with (e.g. 'claude-opus' and 'claude3' ->
+        'claude'), or None if unknown
+    """
+    if model in MODEL_HANDLERS:
+        return model
+    return next((family for family in MODEL_FAMILIES if model.startswith(family)), None)
+
+
+def resolve_model_handler(model: str):
+    """
+    Find the handler that calls the given model.
+
+    Args:
+        model: Model identifier from the request
+
+    Returns:
+        Handler callable taking (messages, model, data), or None if unknown
+    """
+    return MODEL_HANDLERS.get(model_family(model))
+
+
+def register_routes(app, conversation_manager, prompt_config, llm_dispatcher=None,
+                    semantic_cache=None, response_cache=None):
     """
     Register all API routes with the Flask app.
 
@@ -21,13 +407,136 @@ def register_routes(app, conversation_manager, prompt_config):
         app: Flask application instance
         conversation_manager: ConversationManager instance
         prompt_config: PromptConfig instance
+        llm_dispatcher: Optional LLMDispatcher for model calls (a default
+            one is created if not provided)
+        semantic_cache: Optional SemanticCache for cacheable requests (a
+            default one is created if not provided)
+        response_cache: Optional CacheBackend for exact-match caching of
+            cacheable requests (an in-process LRU if not provided)
     """
+    llm_dispatcher = llm_dispatcher or LLMDispatcher()
+    semantic_cache = semantic_cache or SemanticCache()
+    response_cache = response_cache or LRUCacheBackend()
+
+    # A self-hosted Socket.IO client saves a cross-origin connection on cold
+    # loads; it is pinned by content hash and integrity like the other assets
+    dashboard_assets = ['app.css', 'app.js']
+    socketio_path = os.path.join(app.static_folder, SOCKETIO_CLIENT)
+    if os.path.exists(socketio_path):
+        dashboard_assets.append(SOCKETIO_CLIENT)
+        socketio_src = f'/static/{SOCKETIO_CLIENT}?v={asset_version(socketio_path)}'
+        socketio_integrity = subresource_integrity(socketio_path)
+    else:
+        socketio_src = SOCKETIO_CDN_URL
+        socketio_integrity = None
+
+    # The dashboard page is static: render, encode, compress and hash it once
+    index_template = jinja2.Environment(autoescape=True, auto_reload=False).from_string(get_index_template())
+    index_html = index_template.render(
+        css_version=asset_version(os.path.join(app.static_folder, 'app.css')),
+        js_version=asset_version(os.path.join(app.static_folder, 'app.js')),
+        socketio_src=socketio_src,
+        socketio_integrity=socketio_integrity
+    ).encode('utf-8')
+    index_etag = hashlib.md5(index_html, usedforsecurity=False).hexdigest()
+    index_variants = compress_variants(index_html)
+    # The page is rendered fresh for each process, so it changed at startup
+    index_modified = time.time()
+
+    # The dashboard's own assets are fixed for the life of the process too;
+    # serve them precompressed and leave any other static file to Flask
+    static_assets = {}
+    for filename in dashboard_assets:
+        path = os.path.join(app.static_folder, filename)
+        with open(path, 'rb') as f:
+            body = f.read()
+        static_assets[filename] = (
+            compress_variants(body),
+            mimetypes.guess_type(filename)[0],
+            hashlib.md5(body, usedforsecurity=False).hexdigest(),
+            os.path.getmtime(path)
+        )
+    send_static_file = app.view_functions['static']
+
+    def static(filename):
+        """Serve a static file, precompressed when it is a dashboard asset"""
+        asset = static_assets.get(filename)
+        if asset is None:
+            return send_static_file(filename=filename)
+        response = precompressed_response(*asset)
+        # URLs carry a content hash (?v=...), so the file can be cached for good
+        response.cache_control.public = True
+        response.cache_control.max_age = app.get_send_file_max_age(filename)
+        response.cache_control.immutable = True
+        return response.make_conditional(request)
+
+    app.view_functions['static'] = static
 
     @app.route('/health', methods=['GET'])
     def health_check():
         """Health check endpoint"""
         return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
 
+    def start_chat(data):
+        """
+        Set up a chat request: resolve the model and conversation, record
+        the user message and build the messages to send.
+
+        Args:
+            data: Request body
+
+        Returns:
+            Tuple of (conversation ID, model handler, messages to send)
+
+        Raises:
+            ChatRequestError: If the model or conversation is unknown
+        """
+        model = data.get('model', 'gpt-5')
+        conv_id = data.get('conversation_id')
+
+        handler = resolve_model_handler(model)
+        if handler is None:
+            raise ChatRequestError(f'Unknown model: {model}')
+
+        # Handle conversation management (one lookup per request)
+        if data.get('new_conversation', False) or not conv_id:
+            conv_id = conversation_manager.create_conversation(model, data.get('metadata', {}))
+        conversation = conversation_manager.get_conversation(conv_id)
+        if conversation is None:
+            raise ChatRequestError('Conversation not found', 404)
+
+        # Add user message
+        conversation_manager.add_message(conv_id, 'user', data.get('prompt', ''))
+
+        # Get the recent conversation history for context
+        messages = build_context(conversation, llm_dispatcher, conversation_manager)
+
+        # Send the clarification prompt as a system message, so the
+        # request prefix stays the same across turns (provider-side
+        # prompt caching) and the stored user message stays as typed
+        if data.get('include_clarification', True):
+            messages = with_system_prompt(messages, prompt_config.get_prompt('clarification'))
+
+        return conv_id, handler, messages
+
+    def response_pieces(conv_id, model, handler, messages, data):
+        """
+        Yield a model's response in pieces: as generated for models that
+        support streaming, otherwise as a single piece.
+
+        Used by /api/chat/stream. Streamed pieces are also relayed to the
+        dashboard as they arrive; the caller stores the full response once
+        it is complete.
+        """
+        stream_handler = STREAM_HANDLERS.get(model_family(model))
+        if stream_handler is None:
+            # Identical in-flight requests share one call
+            yield llm_dispatcher.submit(handler, messages, model, data).result()
+            return
+        for delta in stream_handler(messages, model, data):
+            conversation_manager.add_chunk(conv_id, delta)
+            yield delta
+
     @app.route('/api/chat', methods=['POST'])
     def chat():
         """
@@ -42,65 +551,49 @@ def register_routes(app, conversation_manager, prompt_config):
             "include_clarification": true,
             "reasoning_effort": "high" | "medium" | "low" | "minimal",
             "file_paths": ["optional-file-paths-for-o3-pro-and-gemini"],
+            "cacheable": false,
             "metadata": {}
         }
 
-        Note: o3-pro and gemini always use maximum effort (high) for reasoning
+        Note: o3-pro and gemini always use maximum effort (high) for reasoning.
+        Only the first message and the most recent history (see
+        MAX_CONTEXT_MESSAGES / MAX_CONTEXT_CHARS) are sent to the model,
+        with a summary of the messages in between once one is available.
+        With "cacheable": true, requests sent without clarification or
+        files may be answered from a cache: an exact match on the whole
+        history, or, for the first prompt of a conversation, a semantically
+        similar earlier prompt.
         """
         try:
             data = request.json
             model = data.get('model', 'gpt-5')
             prompt = data.get('prompt', '')
-            conv_id = data.get('conversation_id')
-            new_conversation = data.get('new_conversation', False)
             include_clarification = data.get('include_clarification', True)
-            reasoning_effort = data.get('reasoning_effort', 'high')
-            metadata = data.get('metadata', {})
 
-            # Add clarification prompt if requested
-            if include_clarification:
-                clarification_prompt = prompt_config.get_prompt('clarification')
-                if clarification_prompt:
-                    prompt = f"{clarification_prompt}\n\n{prompt}"
+            conv_id, handler, messages = start_chat(data)
 
-            # Handle conversation management
-            if new_conversation or not conv_id:
-                conv_id = conversation_manager.create_conversation(model, metadata)
-            elif not conversation_manager.get_conversation(conv_id):
-                return jsonify({'error': 'Conversation not found'}), 404
-
-            conversation = conversation_manager.get_conversation(conv_id)
-
-            # Add user message
-            conversation_manager.add_message(conv_id, 'user', prompt)
-
-            # Get conversation history for context
-            messages = conversation.messages
-
-            # Call appropriate model
-            if model == 'o3-pro':
-                # O3-Pro uses maximum effort by default as requested
-                file_paths = data.get('file_paths', [])  # Optional file paths for o3-pro
-                response = call_o3_pro(messages, reasoning_effort='high', file_paths=file_paths)
-            elif model.startswith('gpt'):
-                response = call_gpt5(messages, reasoning_effort)
-            elif model.startswith('claude'):
-                # Map model names
-                model_map = {
-                    'claude': 'claude-sonnet-4-5-20250929',
-                    'claude-opus': 'claude-opus-4-1-20250805',
-                }
-                claude_model = model_map.get(model, model)
-                response = call_claude(messages, claude_model)
-            elif model.startswith('grok'):
-                # Route to Grok models
-                response = call_grok(messages, model=model)
-            elif model.startswith('gemini'):
-                # Route to Gemini 2.5 Pro with MAXIMUM reasoning power and file support
-                file_paths = data.get('file_paths', [])  # Optional file paths for gemini
-                response = call_gemini(messages, file_paths=file_paths)
+            def call_model():
+                # Runs on the dispatcher's worker pool; identical in-flight
+                # requests share one upstream call
+                return llm_dispatcher.submit(handler, messages, model, data).result()
+
+            if data.get('cacheable', False) and not include_clarification and not data.get('file_paths'):
+                # Exact match on model, settings and the history sent
+                key = cache_key(model, messages, data.get('reasoning_effort', 'high'), [])
+                response = response_cache.get(key)
+                if response is None:
+                    if len(messages) == 1:
+                        # Standalone prompt: similar earlier prompts may match
+                        cache_bucket = f"{model}:{data.get('reasoning_effort', '')}"
+                        response = semantic_cache.get_or_compute(cache_bucket, prompt, call_model)
+                    else:
+                        response = call_model()
+                    # An empty response (e.g. reasoning used up the output
+                    # budget) is not an answer worth replaying
+                    if response:
+                        response_cache.set(key, response)
             else:
-                return jsonify({'error': f'Unknown model: {model}'}), 400
+                response = call_model()
 
             # Add assistant response
             conversation_manager.add_message(conv_id, 'assistant', response, model)
@@ -112,13 +605,144 @@ def register_routes(app, conversation_manager, prompt_config):
                 'timestamp': datetime.now().isoformat()
             })
 
+        except ChatRequestError as e:
+            return jsonify({'error': str(e)}), e.status
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+
+    @app.route('/api/chat/stream', methods=['POST'])
+    def chat_stream():
+        """
+        Chat endpoint that streams the response as Server-Sent Events
+
+        Takes the same request body as /api/chat ("cacheable" is ignored)
+        and answers with a text/event-stream:
+
+            event: start  data: {"conversation_id": ..., "model": ...}
+            data: {"delta": "..."}           (repeated, one per piece)
+            event: done   data: {"conversation_id": ..., "model": ..., "timestamp": ...}
+
+        or "event: error" with {"error": ...} if the model call fails.
+        Models without streaming support send their response as one piece.
+        The complete response is added to the conversation at the end.
+        """
+        try:
+            data = request.json
+            model = data.get('model', 'gpt-5')
+            conv_id, handler, messages = start_chat(data)
+        except ChatRequestError as e:
+            return jsonify({'error': str(e)}), e.status
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+
+        def generate():
+            yield sse_event({'conversation_id': conv_id, 'model': model}, 'start')
+            parts = []
+            try:
+                for delta in response_pieces(conv_id, model, handler, messages, data):
+                    parts.append(delta)
+                    yield sse_event({'delta': delta})
+            except Exception as e:
+                conversation_manager.fail_stream(conv_id, str(e))
+                yield sse_event({'error': str(e)}, 'error')
+                return
+            except GeneratorExit:
+                # The client went away mid-stream; nothing will be stored
+                conversation_manager.fail_stream(conv_id, 'Client disconnected')
+                raise
+
+            conversation_manager.add_message(conv_id, 'assistant', ''.join(parts), model)
+            yield sse_event({
+                'conversation_id': conv_id,
+                'model': model,
+                'timestamp': datetime.now().isoformat()
+            }, 'done')
+
+        response = Response(generate(), mimetype='text/event-stream')
+        response.headers['Cache-Control'] = 'no-cache'
+        # Tell nginx-style proxies not to buffer the stream
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
+
+    @app.route('/api/chat/fanout', methods=['POST'])
+    def chat_fanout():
+        """
+        Send one prompt to several models concurrently
+
+        Each model gets its own new conversation, and all calls run in
+        parallel on the dispatcher's worker pool, so the request takes about
+        as long as the slowest model rather than the sum of all of them.
+
+        Request body:
+        {
+            "models": ["gpt-5", "claude", "gemini"],
+            "prompt": "Your message here",
+            "include_clarification": true,
+            "reasoning_effort": "high" | "medium" | "low" | "minimal",
+            "file_paths": ["optional-file-paths-for-o3-pro-and-gemini"],
+            "metadata": {}
+        }
+
+        Response: {"results": [{"model", "conversation_id", "response"} or
+        {"model", "conversation_id", "error"}, ...]} in request order.
+        """
+        try:
+            data = request.json
+            models = data.get('models', [])
+            prompt = data.get('prompt', '')
+            metadata = data.get('metadata', {})
+
+            if not models:
+                return jsonify({'error': 'No models given'}), 400
+            handlers = [resolve_model_handler(model) for model in models]
+            unknown = [model for model, handler in zip(models, handlers) if handler is None]
+            if unknown:
+                return jsonify({'error': f'Unknown model: {", ".join(unknown)}'}), 400
+
+            # Clarification prompt is sent as a system message, as in chat()
+            clarification = None
+            if data.get('include_clarification', True):
+                clarification = prompt_config.get_prompt('clarification')
+
+            # Start every call before waiting on any of them
+            calls = []
+            for model, handler in zip(models, handlers):
+                conv_id = conversation_manager.create_conversation(model, metadata)
+                conversation_manager.add_message(conv_id, 'user', prompt)
+                conversation = conversation_manager.get_conversation(conv_id)
+                with conversation.lock:
+                    messages = with_system_prompt(list(conversation.messages), clarification)
+                calls.append((model, conv_id, llm_dispatcher.submit(handler, messages, model, data)))
+
+            results = []
+            for model, conv_id, future in calls:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    results.append({'model': model, 'conversation_id': conv_id, 'error': str(e)})
+                    continue
+                conversation_manager.add_message(conv_id, 'assistant', response, model)
+                results.append({'model': model, 'conversation_id': conv_id, 'response': response})
+
+            return jsonify({'results': results, 'timestamp': datetime.now().isoformat()})
+
         except Exception as e:
             return jsonify({'error': str(e)}), 500
 
     @app.route('/api/conversations', methods=['GET'])
     def list_conversations():
         """List all active conversations"""
-        return jsonify(conversation_manager.list_conversations())
+        # Read the version first: if the list changes in between, the ETag
+        # is older than the body and the next request simply refetches
+        version = conversation_manager.list_version()
+        if request.if_none_match.contains(version):
+            response = Response(status=304)
+        else:
+            response = jsonify(conversation_manager.list_conversations())
+        response.set_etag(version)
+        # Revalidate every time; unchanged lists cost an empty 304
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
 
     @app.route('/api/conversations/<conv_id>', methods=['GET'])
     def get_conversation(conv_id):
@@ -127,14 +751,16 @@ def register_routes(app, conversation_manager, prompt_config):
         if not conversation:
             return jsonify({'error': 'Conversation not found'}), 404
 
-        return jsonify({
-            'id': conversation.id,
-            'model': conversation.model,
-            'messages': [asdict(msg) for msg in conversation.messages],
-            'created_at': conversation.created_at,
-            'updated_at': conversation.updated_at,
-            'metadata': conversation.metadata
-        })
+        # Serialized once per change and reused by every read until then
+        with conversation.lock:
+            body, etag = conversation.to_json()
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
 
     @app.route('/api/conversations/<conv_id>', methods=['DELETE'])
     def delete_conversation(conv_id):
@@ -162,4 +788,7 @@ def register_routes(app, conversation_manager, prompt_config):
     @app.route('/')
     def index():
         """Serve the web interface for monitoring conversations"""
-        return render_template_string(get_index_template())
+        response = precompressed_response(index_variants, 'text/html', index_etag, index_modified)
+        # Always revalidate; unchanged pages are answered with an empty 304
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
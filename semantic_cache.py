@@ -0,0 +1,144 @@
+"""
+Semantic Cache
+==============
+Reuses model responses for prompts that mean the same thing as an earlier
+prompt. Prompts are embedded with a local SentenceTransformer model and
+compared by cosine similarity.
+
+Requires the optional sentence-transformers and numpy packages; without
+them the cache is disabled and every request goes to the model.
+"""
+
+import re
+import threading
+import collections
+import importlib.util
+from typing import Callable, Iterable, Optional
+
+# Only check that the packages are installed here: sentence-transformers
+# loads torch when imported, so both are imported when the encoder is
+# first needed, not at server start
+EMBEDDINGS_AVAILABLE = all(
+    importlib.util.find_spec(package) is not None for package in ('numpy', 'sentence_transformers')
+)
+
+
+# Prompts whose answer depends on when they are asked are never cached
+DEFAULT_EXCLUDE_PATTERNS = (
+    r'\b(today|tonight|tomorrow|yesterday|now|currently|latest|recent(ly)?)\b',
+    r'\bthis (morning|week|month|year)\b',
+    r'\b(time|date|weather|news|price|stock)s?\b',
+)
+
+
+class SemanticCache:
+    """LRU cache of model responses, looked up by prompt similarity"""
+
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', threshold: float = 0.92,
+                 max_entries: int = 10_000,
+                 exclude_patterns: Iterable[str] = DEFAULT_EXCLUDE_PATTERNS):
+        """
+        Initialize the cache. The embedding model is loaded on first use.
+
+        Args:
+            model_name: SentenceTransformer model used to embed prompts
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached responses (LRU eviction)
+            exclude_patterns: Regexes (case-insensitive) for prompts that
+                must never be cached
+        """
+        self.enabled = EMBEDDINGS_AVAILABLE
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._exclude = re.compile('|'.join(exclude_patterns), re.IGNORECASE) if exclude_patterns else None
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
+
+        # Entries live in fixed slots of a normalized embedding matrix so a
+        # lookup is a single matrix-vector product. _bucket_ids holds each
+        # slot's bucket id (-1 for empty slots); _lru orders used slots.
+        self._lock = threading.Lock()
+        self._matrix = None
+        self._bucket_ids = None
+        self._responses = [None] * max_entries
+        self._lru = collections.OrderedDict()
+        self._bucket_index = {}
+
+    def get_or_compute(self, bucket: str, prompt: str, compute: Callable[[], str]) -> str:
+        """
+        Return a cached response for a similar prompt, or compute and cache one.
+
+        Args:
+            bucket: Cache partition; only prompts in the same bucket (e.g.
+                same model and settings) can match each other
+            prompt: The prompt to look up
+            compute: Produces the response on a miss
+
+        Returns:
+            The cached or freshly computed response
+
+        Raises:
+            Exception: Whatever compute raises; a failed call caches nothing
+        """
+        if not self.enabled or (self._exclude is not None and self._exclude.search(prompt)):
+            return compute()
+
+        embedding = self._embed(prompt)
+        cached = self._lookup(bucket, embedding)
+        if cached is not None:
+            return cached
+
+        # Failures propagate from compute() before anything is stored; an
+        # empty response is not an answer worth replaying either
+        response = compute()
+        if response:
+            self._store(bucket, embedding, response)
+        return response
+
+    def _embed(self, prompt: str):
+        """Embed a prompt as a unit-length float32 vector"""
+        import numpy as np
+
+        with self._encoder_lock:
+            if self._encoder is None:
+                from sentence_transformers import SentenceTransformer
+                self._encoder = SentenceTransformer(self.model_name)
+        return self._encoder.encode(prompt, normalize_embeddings=True).astype(np.float32)
+
+    def _lookup(self, bucket: str, embedding) -> Optional[str]:
+        """Return the response of the most similar cached prompt above the threshold"""
+        import numpy as np
+
+        with self._lock:
+            bucket_id = self._bucket_index.get(bucket)
+            if bucket_id is None or not self._lru:
+                return None
+            # Vectors are normalized, so the dot product is the cosine similarity
+            scores = self._matrix @ embedding
+            scores[self._bucket_ids != bucket_id] = -1.0
+            slot = int(np.argmax(scores))
+            if scores[slot] < self.threshold:
+                return None
+            self._lru.move_to_end(slot)
+            return self._responses[slot]
+
+    def _store(self, bucket: str, embedding, response: str):
+        """Cache a response, evicting the least recently used entry when full"""
+        import numpy as np
+
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+                self._bucket_ids = np.full(self.max_entries, -1, dtype=np.int32)
+
+            if len(self._lru) < self.max_entries:
+                slot = len(self._lru)
+            else:
+                slot, _ = self._lru.popitem(last=False)
+
+            bucket_id = self._bucket_index.setdefault(bucket, len(self._bucket_index))
+            self._matrix[slot] = embedding
+            self._bucket_ids[slot] = bucket_id
+            self._responses[slot] = response
+            self._lru[slot] = None
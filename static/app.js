@@ -0,0 +1,516 @@
+const socket = io({ transports: ['websocket'], upgrade: false });
+const msgTemplate = document.getElementById('msg-tpl').content.firstElementChild;
+const convTemplate = document.getElementById('conv-item-tpl').content.firstElementChild;
+let conversations = {};
+const convEls = new Map(); // conversation id -> <li>
+let activeConversationId = null;
+let totalMessages = 0;
+
+// Initialize
+loadConversations();
+
+// One delegated listener serves every conversation row, present or future
+document.getElementById('conversation-list').addEventListener('click', (e) => {
+    const item = e.target.closest('.conversation-item');
+    if (item) loadConversation(item.dataset.id);
+});
+
+// Socket listeners
+socket.on('new_messages_batch', (batch) => {
+    handleNewMessages(batch);
+});
+
+socket.on('message_chunk', (data) => {
+    handleMessageChunk(data);
+});
+
+socket.on('stream_error', (data) => {
+    handleStreamError(data);
+});
+
+socket.on('conversation_updated', (conv) => {
+    updateConversationItem(conv);
+});
+
+socket.on('conversations_deleted', (convIds) => {
+    removeConversationItems(convIds);
+});
+
+// Updates may have been missed while disconnected
+socket.io.on('reconnect', scheduleLoad);
+
+// Collapse bursts of reload requests (e.g. a flapping connection) into
+// one fetch; unchanged lists come back as an empty 304
+let loadPending = null;
+function scheduleLoad() {
+    if (loadPending) return;
+    loadPending = setTimeout(() => {
+        loadPending = null;
+        loadConversations();
+    }, 250);
+}
+
+async function loadConversations() {
+    try {
+        const response = await fetch('/api/conversations');
+        const data = await response.json();
+        updateConversationList(data);
+    } catch (error) {
+        console.error('Error loading conversations:', error);
+    }
+}
+
+async function loadConversation(convId) {
+    try {
+        const response = await fetch(`/api/conversations/${convId}`);
+        const data = await response.json();
+        displayConversation(data);
+        activeConversationId = convId;
+        updateActiveConversation();
+    } catch (error) {
+        console.error('Error loading conversation:', error);
+    }
+}
+
+function updateConversationList(convList) {
+    const listEl = document.getElementById('conversation-list');
+    const previous = new Map(convEls);
+    conversations = {};
+    convEls.clear();
+
+    if (convList.length === 0) {
+        listEl.replaceChildren(emptyState('li', 'No conversations yet'));
+        document.getElementById('conversation-count').textContent = '0 conversations';
+        return;
+    }
+
+    // Most recently updated first, matching where updates are prepended.
+    // Rows already on screen are reused and only their changed text is
+    // touched; rows for conversations that are gone are dropped.
+    convList.sort((a, b) => b.updated_at.localeCompare(a.updated_at));
+    const frag = document.createDocumentFragment();
+    const now = Date.now();
+    convList.forEach(conv => {
+        conversations[conv.id] = conv;
+        let li = previous.get(conv.id);
+        if (li) {
+            fillConversationItem(li, conv, now);
+        } else {
+            li = createConversationItem(conv, now);
+        }
+        convEls.set(conv.id, li);
+        frag.appendChild(li);
+    });
+    listEl.replaceChildren(frag);
+
+    updateActiveConversation();
+    document.getElementById('conversation-count').textContent = `${convList.length} conversations`;
+}
+
+function createConversationItem(conv, now = Date.now()) {
+    const li = convTemplate.cloneNode(true);
+    li.dataset.id = conv.id;
+    fillConversationItem(li, conv, now);
+    return li;
+}
+
+function fillConversationItem(li, conv, now = Date.now()) {
+    setText(li.querySelector('.model'), conv.model.toUpperCase());
+    setText(li.querySelector('.count'), `${conv.message_count} messages`);
+    setRelativeTime(li.querySelector('.time'), conv.updated_at, now);
+}
+
+// Placeholder shown in an empty list; built as nodes, never parsed from HTML
+function emptyState(tag, text) {
+    const el = document.createElement(tag);
+    el.className = 'empty-state';
+    el.textContent = text;
+    return el;
+}
+
+// Write text only when it changed, so unchanged rows cost no layout
+function setText(el, text) {
+    if (el.textContent !== text) el.textContent = text;
+}
+
+function updateConversationItem(conv) {
+    const listEl = document.getElementById('conversation-list');
+    conversations[conv.id] = conv;
+
+    let li = convEls.get(conv.id);
+    if (li) {
+        fillConversationItem(li, conv);
+    } else {
+        if (convEls.size === 0) listEl.replaceChildren(); // Drop the empty state
+        li = createConversationItem(conv);
+        li.classList.toggle('active', conv.id === activeConversationId);
+        convEls.set(conv.id, li);
+        document.getElementById('conversation-count').textContent = `${convEls.size} conversations`;
+    }
+    if (listEl.firstElementChild !== li) listEl.prepend(li);
+}
+
+function removeConversationItems(convIds) {
+    const listEl = document.getElementById('conversation-list');
+    convIds.forEach(id => {
+        const li = convEls.get(id);
+        if (!li) return;
+        li.remove();
+        convEls.delete(id);
+        delete conversations[id];
+        if (id === activeConversationId) {
+            activeConversationId = null;
+            resetMessageView();
+            messagesEl.replaceChildren(emptyState('div', 'Conversation deleted'));
+        }
+    });
+
+    if (convEls.size === 0) listEl.replaceChildren(emptyState('li', 'No conversations yet'));
+    document.getElementById('conversation-count').textContent = `${convEls.size} conversations`;
+}
+
+function displayConversation(conv) {
+    resetMessageView();
+
+    if (!conv.messages || conv.messages.length === 0) {
+        messagesEl.replaceChildren(emptyState('div', 'No messages in this conversation'));
+        return;
+    }
+
+    addMessagesToDisplay(conv.messages);
+    scheduleScroll();
+}
+
+function addMessageToDisplay(msg) {
+    addMessagesToDisplay([msg]);
+}
+
+// Rows are only indexed here; renderMessages mounts the visible ones in
+// one fragment on the next frame, so a batch costs one DOM update
+function addMessagesToDisplay(msgs) {
+    if (msgs.length === 0) return;
+    if (viewMessages.length === 0) {
+        messagesEl.replaceChildren(spacerEl);
+    }
+    msgs.forEach(msg => {
+        viewMessages.push(msg);
+        rowHeights.push(ESTIMATED_ROW_HEIGHT);
+    });
+    totalMessages += msgs.length;
+    document.getElementById('message-count').textContent = `${totalMessages} messages`;
+}
+
+function handleNewMessages(batch) {
+    let changed = false;
+    const added = [];
+    batch.forEach(data => {
+        if (data.conversation_id !== activeConversationId) return;
+        if (streamingIndex !== null && data.message.role === 'assistant') {
+            // The complete message replaces its streamed placeholder
+            replaceMessage(streamingIndex, data.message);
+            streamingIndex = null;
+        } else {
+            added.push(data.message);
+        }
+        changed = true;
+    });
+    addMessagesToDisplay(added);
+    if (changed) {
+        scheduleScroll();
+    }
+}
+
+// Index of the assistant message being streamed into, if any
+let streamingIndex = null;
+
+function handleMessageChunk(data) {
+    if (data.conversation_id !== activeConversationId) return;
+    if (streamingIndex === null) {
+        addMessageToDisplay({
+            role: 'assistant',
+            content: '',
+            timestamp: new Date().toISOString(),
+            model: conversations[data.conversation_id]?.model || null
+        });
+        streamingIndex = viewMessages.length - 1;
+    }
+    const msg = viewMessages[streamingIndex];
+    msg.content += data.delta;
+    const row = mountedRows.get(streamingIndex);
+    if (row) {
+        // Extend the existing text node instead of resetting it
+        const contentEl = row.querySelector('.message-content');
+        if (contentEl.firstChild) {
+            contentEl.firstChild.appendData(data.delta);
+        } else {
+            contentEl.textContent = msg.content;
+        }
+    }
+    scheduleScroll();
+}
+
+// A stream that ends without a complete message leaves its partial text
+// in place, marked as interrupted; later chunks start a new message
+function handleStreamError(data) {
+    if (data.conversation_id !== activeConversationId || streamingIndex === null) return;
+    const msg = viewMessages[streamingIndex];
+    replaceMessage(streamingIndex, { ...msg, content: `${msg.content}\n\n[Response interrupted: ${data.error}]` });
+    streamingIndex = null;
+    scheduleScroll();
+}
+
+function replaceMessage(index, msg) {
+    viewMessages[index] = msg;
+    const row = mountedRows.get(index);
+    if (row) {
+        fillMessageNode(row.firstElementChild, msg);
+    }
+}
+
+// Virtualized message list: only the rows around the viewport are
+// mounted, positioned with translateY inside a spacer sized to the
+// whole conversation. Rows are recycled, and heights are estimated
+// until a row has been measured.
+const ESTIMATED_ROW_HEIGHT = 120;
+const OVERSCAN_ROWS = 5;
+
+// Fenwick tree over row heights: O(log n) offset <-> index lookups
+class HeightIndex {
+    constructor() {
+        this.heights = [];
+        this.tree = [0]; // 1-based
+    }
+
+    push(height) {
+        const i = this.heights.length + 1;
+        this.heights.push(height);
+        this.tree.push(height + this.prefix(i - 1) - this.prefix(i - (i & -i)));
+    }
+
+    set(index, height) {
+        const delta = height - this.heights[index];
+        this.heights[index] = height;
+        for (let i = index + 1; i < this.tree.length; i += i & -i) {
+            this.tree[i] += delta;
+        }
+    }
+
+    // Total height of the first n rows
+    prefix(n) {
+        let sum = 0;
+        for (let i = n; i > 0; i -= i & -i) {
+            sum += this.tree[i];
+        }
+        return sum;
+    }
+
+    total() {
+        return this.prefix(this.heights.length);
+    }
+
+    // Index of the row containing vertical offset y
+    find(y) {
+        const n = this.heights.length;
+        let pos = 0;
+        for (let step = n ? 1 << Math.floor(Math.log2(n)) : 0; step > 0; step >>= 1) {
+            if (pos + step <= n && this.tree[pos + step] <= y) {
+                pos += step;
+                y -= this.tree[pos];
+            }
+        }
+        return Math.min(pos, n - 1);
+    }
+}
+
+const messagesEl = document.getElementById('messages');
+const spacerEl = document.createElement('div');
+spacerEl.className = 'messages-spacer';
+let viewMessages = [];
+let rowHeights = new HeightIndex();
+const mountedRows = new Map(); // message index -> row element
+const freeRows = [];
+let renderPending = false;
+let scrollPending = false;
+
+messagesEl.addEventListener('scroll', scheduleRender, { passive: true });
+// Any change to the pane's size (window resize, layout changes) changes
+// which rows are visible and how tall wrapped rows are
+new ResizeObserver(scheduleRender).observe(messagesEl);
+
+function resetMessageView() {
+    mountedRows.forEach(releaseRow);
+    mountedRows.clear();
+    viewMessages = [];
+    rowHeights = new HeightIndex();
+    streamingIndex = null;
+}
+
+// Scroll to the bottom on the next frame; bursts of messages cost
+// one layout per frame rather than one per message
+function scheduleScroll() {
+    scrollPending = true;
+    scheduleRender();
+}
+
+function scheduleRender() {
+    if (renderPending) return;
+    renderPending = true;
+    requestAnimationFrame(renderMessages);
+}
+
+function renderMessages() {
+    const stickToBottom = scrollPending;
+    renderPending = false;
+    scrollPending = false;
+    const count = viewMessages.length;
+    if (count === 0) return;
+
+    if (stickToBottom) {
+        spacerEl.style.height = `${rowHeights.total()}px`;
+        messagesEl.scrollTop = messagesEl.scrollHeight;
+    }
+
+    // A second pass is only needed when measuring shifted the window
+    for (let pass = 0; pass < 2; pass++) {
+        const top = Math.max(0, messagesEl.scrollTop - spacerEl.offsetTop);
+        const start = Math.max(0, rowHeights.find(top) - OVERSCAN_ROWS);
+        const end = Math.min(count, rowHeights.find(top + messagesEl.clientHeight) + 1 + OVERSCAN_ROWS);
+
+        mountedRows.forEach((row, i) => {
+            if (i < start || i >= end) {
+                releaseRow(row);
+                mountedRows.delete(i);
+            }
+        });
+        // New rows are attached together once the pool runs dry
+        const frag = document.createDocumentFragment();
+        const now = Date.now();
+        for (let i = start; i < end; i++) {
+            if (!mountedRows.has(i)) {
+                const row = freeRows.pop() || createRow(frag);
+                fillMessageNode(row.firstElementChild, viewMessages[i], now);
+                row.hidden = false;
+                mountedRows.set(i, row);
+            }
+        }
+        spacerEl.appendChild(frag);
+
+        // Read all heights before writing any positions
+        let changed = false;
+        mountedRows.forEach((row, i) => {
+            const height = row.offsetHeight;
+            if (height !== rowHeights.heights[i]) {
+                rowHeights.set(i, height);
+                changed = true;
+            }
+        });
+        mountedRows.forEach((row, i) => {
+            row.style.transform = `translateY(${rowHeights.prefix(i)}px)`;
+        });
+        spacerEl.style.height = `${rowHeights.total()}px`;
+        if (stickToBottom) {
+            messagesEl.scrollTop = messagesEl.scrollHeight;
+        }
+        if (!changed) break;
+    }
+}
+
+function createRow(parent) {
+    const row = document.createElement('div');
+    row.className = 'message-row';
+    row.appendChild(msgTemplate.cloneNode(true));
+    parent.appendChild(row);
+    return row;
+}
+
+function releaseRow(row) {
+    row.hidden = true;
+    freeRows.push(row);
+}
+
+function fillMessageNode(msgEl, msg, now = Date.now()) {
+    msgEl.className = `message ${msg.role}`;
+    const roleEl = msgEl.querySelector('.message-role');
+    roleEl.className = `message-role ${msg.role}`;
+    roleEl.textContent = msg.role;
+    const modelEl = msgEl.querySelector('.message-model');
+    modelEl.textContent = msg.model || '';
+    modelEl.hidden = !msg.model;
+    setRelativeTime(msgEl.querySelector('.message-time'), msg.timestamp, now);
+    msgEl.querySelector('.message-content').textContent = msg.content;
+}
+
+function updateActiveConversation() {
+    convEls.forEach((el, id) => {
+        el.classList.toggle('active', id === activeConversationId);
+    });
+}
+
+async function sendTestMessage() {
+    const model = document.getElementById('test-model').value;
+    const prompt = document.getElementById('test-prompt').value;
+
+    if (!prompt) return;
+
+    try {
+        const response = await fetch('/api/chat', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                model: model,
+                prompt: prompt,
+                new_conversation: !activeConversationId
+            })
+        });
+
+        const data = await response.json();
+        if (data.conversation_id) {
+            loadConversation(data.conversation_id);
+        }
+
+        document.getElementById('test-prompt').value = '';
+    } catch (error) {
+        console.error('Error sending test message:', error);
+        alert('Error sending message: ' + error.message);
+    }
+}
+
+// Relative times ("5 minutes ago") are tracked per element and refreshed
+// by one timer; an element is only written when its label changes
+const rtf = new Intl.RelativeTimeFormat('en', { numeric: 'auto' });
+const timeEls = new Map(); // element -> time in ms
+
+// Callers filling many elements pass one shared now
+function setRelativeTime(el, timestamp, now = Date.now()) {
+    const time = Date.parse(timestamp);
+    timeEls.set(el, time);
+    setText(el, formatTime(time, now));
+}
+
+function updateRelativeTimes() {
+    const now = Date.now();
+    timeEls.forEach((time, el) => {
+        if (el.isConnected) {
+            setText(el, formatTime(time, now));
+        } else {
+            timeEls.delete(el);
+        }
+    });
+}
+
+setInterval(updateRelativeTimes, 30000);
+
+// [age limit in seconds, unit, seconds per unit]; older times show a date
+const TIME_UNITS = [
+    [60, null, 1],
+    [3600, 'minute', 60],
+    [86400, 'hour', 3600]
+];
+
+function formatTime(time, now) {
+    const diff = (now - time) / 1000;
+    for (const [limit, unit, size] of TIME_UNITS) {
+        if (diff < limit) return unit ? rtf.format(-Math.floor(diff / size), unit) : 'just now';
+    }
+    return new Date(time).toLocaleDateString();
+}